@@ -151,7 +151,7 @@ class ActionBase(object):
             role_arn = handlers.ARN_ROLE_TEMPLATE.format(account, role_name) if role_name is not None else None
             self._logger_.debug("Role arn is \"{}\"", role_arn)
 
-            return services.get_session(role_arn=role_arn, logger=logger)
+            return services.get_session(role_arn=role_arn, logger=logger, account=account)
         except Exception as ex:
             if logger is not None:
                 logger.error(handlers.ERR_CREATING_SESSION, ex)
@@ -562,7 +562,7 @@ def get_task_session(account, task, this_account=False, logger=None):
     role_arn = get_account_role(account, task, logger=logger)
 
     try:
-        return services.get_session(role_arn=role_arn, logger=logger), role_arn
+        return services.get_session(role_arn=role_arn, logger=logger, account=account), role_arn
     except Exception as ex:
         if logger is not None:
             logger.error(ERR_CREATING_SESSION, ex)
@@ -18,6 +18,9 @@ import traceback
 import types
 from datetime import datetime
 
+# named tuple classes by type name and field names
+_namedtuple_classes = {}
+
 
 def pascal_to_snake_case(s):
     return s[0].lower() + "".join(
@@ -99,7 +102,13 @@ def as_namedtuple(name, d, deep=True, name_func=None, excludes=None):
     else:
         dest = {name_func(key): d[key] for key in list(d.keys())}
 
-    return collections.namedtuple(name_func(name), list(dest.keys()))(*list(dest.values()))
+    # creating a named tuple class is expensive, reuse classes for dictionaries with the same name and keys
+    class_key = (name_func(name), tuple(dest.keys()))
+    tuple_class = _namedtuple_classes.get(class_key)
+    if tuple_class is None:
+        tuple_class = collections.namedtuple(class_key[0], class_key[1])
+        _namedtuple_classes[class_key] = tuple_class
+    return tuple_class(*dest.values())
 
 
 def full_stack():
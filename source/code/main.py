@@ -21,6 +21,7 @@ import configuration.task_configuration
 import handlers
 import handlers.task_tracking_table
 import outputs.queued_logger
+import services
 from helpers import full_stack, safe_dict, safe_json
 
 ECS_TASK_NOT_FOUND_FOR_STEP = "Task {} was not found or is not in a {} state for action step  {}"
@@ -56,6 +57,10 @@ def load_models():
 
 load_models()
 
+# import all service modules at cold start instead of one by one when handling events
+if os.getenv(services.ENV_PRELOAD_SERVICES) == "1":
+    services.preload_all()
+
 
 class EcsTaskContext(object):
 
@@ -10,6 +10,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, tzinfo
 
 import pytz
@@ -86,6 +87,10 @@ class CronExpression(object):
         # this is an optional default time that can be set to test against
         self._date = dt
 
+        # (start, match) of the last forward search for a first match, there are no matches after start and before match so
+        # the same match is returned for every start in that range, stored as a single tuple so it is replaced atomically
+        self._last_first_match = None
+
         # store timezone from dt or timezone parameter
         if dt and dt.tzinfo is not None:
             self._timezone = dt.tzinfo
@@ -183,10 +188,7 @@ class CronExpression(object):
         :return: First match for an expression for a period since a start datetime (excluding) up and until the end datetime,
         None if there was no match
         """
-        end_dtz = self._localized_time(end_dt)
-        for match in self.since(start_dt=since_dt, end_dt=end_dtz, most_recent_first=False):
-            return match
-        return None
+        return self._first_match_forwards(since_dt, end_dt)
 
     def first_within_last(self, timespan, end_dt=None):
         """
@@ -256,9 +258,7 @@ class CronExpression(object):
         :param start_dt: Start datetime (excluding), use None for localized current datetime
         :return: First match for a period from the start datetime until the end datetime, None if there was no match
         """
-        start_dtz = self._localized_time(start_dt)
-        for match in self.until(end_dt, start_dt=start_dtz, earliest_first=True):
-            return match
+        return self._first_match_forwards(start_dt, end_dt)
 
     def first_within_next(self, timespan, start_dt=None):
         """
@@ -268,8 +268,7 @@ class CronExpression(object):
         :return: First match for the period, None if there was no match
         """
         start_dtz = self._localized_time(start_dt)
-        for match in self.within_next(timespan=timespan, start_dt=start_dtz, earliest_first=True):
-            return match
+        return self._first_match_forwards(start_dtz, start_dtz + timespan)
 
     def validate(self):
         """
@@ -299,31 +298,54 @@ class CronExpression(object):
         # minute set builder
         if self._minutes is None:
             self._minutes_builder = MinuteSetBuilder()
-            self._minutes = sorted(self._minutes_builder.build(self._minutes_str))
+            self._minutes = tuple(sorted(self._minutes_builder.build(self._minutes_str)))
 
         # hours set builder
         if self._hours is None:
             self._hours_builder = HourSetBuilder()
-            self._hours = sorted(self._hours_builder.build(self._hours_str))
+            self._hours = tuple(sorted(self._hours_builder.build(self._hours_str)))
 
         # month set builder
         if self._month is None:
             self._month_builder = MonthSetBuilder()
-            self._month = sorted(MonthSetBuilder().build(self._month_str))
+            self._month = tuple(sorted(MonthSetBuilder().build(self._month_str)))
 
         # day of month and day in week builders, note that these depend on the date being tested
         if self._date is None or self._date.date() != dt.date():
             # first time or if date to be tested differs from previous test
             # day of month builder
             self._day_of_month_builder = MonthdaySetBuilder(year=dt.year, month=dt.month)
-            self._day_of_month = sorted(self._day_of_month_builder.build(self._day_of_month_str))
+            self._day_of_month = tuple(sorted(self._day_of_month_builder.build(self._day_of_month_str)))
             # day of week builder
             self._day_of_week_builder = WeekdaySetBuilder(year=dt.year, month=dt.month, day=dt.day)
-            self._day_of_week = sorted(self._day_of_week_builder.build(self._day_of_week_str))
+            self._day_of_week = tuple(sorted(self._day_of_week_builder.build(self._day_of_week_str)))
             # store the date for which the builders are prepared
             self._date = dt.replace(hour=0, minute=0, second=0, microsecond=0)
         return dt
 
+    def _first_match_forwards(self, start_dt, end_dt):
+        """
+        Returns the first match in a period specified by a start and end datetime, the result of the previous search is reused
+        if the start of the period is between the start and the match of that search and is in the same timezone, as the fields
+        of the expression are matched against the local time
+        :param start_dt: Start datetime (excluding)
+        :param end_dt: End datetime (including), use None for localized current datetime
+        :return: First match in the period, None if there was no match
+        """
+        start_dtz = self._localized_time(start_dt)
+        end_dtz = self._localized_time(end_dt)
+
+        last_first_match = self._last_first_match
+        if last_first_match is not None:
+            last_start, last_tzinfo, last_match = last_first_match
+            if last_tzinfo == start_dtz.tzinfo and last_start <= start_dtz < last_match <= end_dtz:
+                return last_match
+
+        for match in self._matches_forwards(start_dtz, end_dtz):
+            self._last_first_match = (start_dtz, start_dtz.tzinfo, match)
+            return match
+        return None
+
     def _matches_backwards(self, start_dt, end_dt):
 
         """
@@ -408,31 +430,20 @@ class CronExpression(object):
         :param dt: Tested datetime
         :return: Last day for expression in previous month
         """
-        # is the current month is the list
-        if dt.month in self._month:
-            # get the index -1, note that if the index is -1  the last item in the list is used so no special
-            # handling required if it is the first one in the list and we have to move back to previous month
-            index = self._month.index(dt.month) - 1
-        else:
-            # find a matching index in the list that is <= current month
-            index = len(self._month) - 1
-            while index >= 0:
-                if self._month[index] <= dt.month:
-                    break
-                index -= 1
-
-        # get the month from the list
-        previous_month = self._month[index]
+        # number of months in the sorted list before the current month, if there are none the last month in the list is used
+        # and the search continues in the previous year
+        index = bisect_left(self._month, dt.month)
+        previous_month = self._month[index - 1]
 
         # year - 1 if the new month is later than the current month
-        year = dt.year if previous_month < dt.month else dt.year - 1
+        year = dt.year if index > 0 else dt.year - 1
 
         previous_month_builder = MonthdaySetBuilder(year=year, month=previous_month)
-        month_days_previous = sorted(previous_month_builder.build(self._day_of_month_str))
-        day = max(month_days_previous) if month_days_previous != [] else previous_month_builder.last
+        month_days_previous = previous_month_builder.build(self._day_of_month_str)
+        day = max(month_days_previous) if month_days_previous else previous_month_builder.last
 
         # return the last event for the last day of the previous month
-        return datetime(year=year, month=previous_month, day=day, hour=max(self._hours), minute=max(self._minutes),
+        return datetime(year=year, month=previous_month, day=day, hour=self._hours[-1], minute=self._minutes[-1],
                         tzinfo=dt.tzinfo)
 
     def _move_to_next_month(self, dt):
@@ -441,28 +452,20 @@ class CronExpression(object):
         :param dt: Tested datetime
         :return: First day in next month for expression
         """
-        # is the current month is the set
-        if dt.month in self._month:
-            # get the index + 1, wrap to first in list if last entry
-            index = (self._month.index(dt.month) + 1) % len(self._month)
+        # index of first month in the sorted list after the current month, wrap to first month of next year if there is none
+        index = bisect_right(self._month, dt.month)
+        if index < len(self._month):
+            next_month = self._month[index]
+            year = dt.year
         else:
-            # find a matching index in the list that is >= current month
-            index = 0
-            while index < len(self._month) - 1:
-                if self._month[index] >= dt.month:
-                    break
-                index += 1
-        # get the month
-        next_month = self._month[index]
-
-        # year + 1 if the new month is earlier than the next month
-        year = dt.year if next_month > dt.month else dt.year + 1
+            next_month = self._month[0]
+            year = dt.year + 1
 
         next_month_builder = MonthdaySetBuilder(year=year, month=next_month)
-        month_days_next = sorted(next_month_builder.build(self._day_of_month_str))
-        day = min(month_days_next) if month_days_next != [] else next_month_builder.first
+        month_days_next = next_month_builder.build(self._day_of_month_str)
+        day = min(month_days_next) if month_days_next else next_month_builder.first
 
-        return datetime(year=year, month=next_month, day=day, hour=min(self._hours), minute=min(self._minutes), tzinfo=dt.tzinfo)
+        return datetime(year=year, month=next_month, day=day, hour=self._hours[0], minute=self._minutes[0], tzinfo=dt.tzinfo)
 
     def _move_to_previous_day(self, dt):
         """
@@ -470,28 +473,15 @@ class CronExpression(object):
         :param dt: Tested datetime
         :return: Next day for expression
         """
+        # number of days in the sorted list before the current day
+        index = bisect_left(self._day_of_month, dt.day)
 
-        # test if day is in the current set
-        if dt.day in self._day_of_month:
-            # if so use the index -1
-            index = self._day_of_month.index(dt.day) - 1
-        else:
-            # otherwise get the index of the first entry equal or less than the current day
-            index = len(self._day_of_month) - 1
-            while index > 0:
-                if self._day_of_month[index] <= dt.day:
-                    break
-                index -= 1
-
-        # get the day from the set, if it is empty use the current day to move into the next month
-        d = self._day_of_month[index] if index > -1 else dt.day
-
-        # if the day > the current day then move back to the last event in the previous month
-        if d >= dt.day:
+        # no earlier day in this month, move back to the last event in the previous month
+        if index == 0:
             return self._move_to_previous_month(dt)
-        else:
-            # last event of previous day in same month
-            return dt.replace(day=d, hour=max(self._hours), minute=max(self._minutes))
+
+        # last event of previous day in same month
+        return dt.replace(day=self._day_of_month[index - 1], hour=self._hours[-1], minute=self._minutes[-1])
 
     def _move_to_next_day(self, dt):
         """
@@ -499,27 +489,15 @@ class CronExpression(object):
         :param dt: Tested datetime
         :return: Next day for expression
         """
-        # test if day is in the current set
-        if dt.day in self._day_of_month:
-            # if so use the index -1
-            index = (self._day_of_month.index(dt.day) + 1) % len(self._day_of_month)
-        else:
-            # otherwise get the index of the first entry >= the current day
-            index = 0
-            while index < len(self._day_of_month) - 1:
-                if self._day_of_month[index] >= dt.day:
-                    break
-                index += 1
-
-        # get the day from the set, if it is empty then use current day to move forward to next month
-        d = self._day_of_month[index] if self._day_of_month != [] else dt.day
-
-        # if the day > the current day then move back to the last event in the previous month
-        if d <= dt.day:
+        # index of first day in the sorted list after the current day
+        index = bisect_right(self._day_of_month, dt.day)
+
+        # no later day in this month, move forward to the first event in the next month
+        if index == len(self._day_of_month):
             return self._move_to_next_month(dt)
-        else:
-            # last event of previous day in same month
-            return dt.replace(day=d, hour=min(self._hours), minute=min(self._minutes))
+
+        # first event of next day in same month
+        return dt.replace(day=self._day_of_month[index], hour=self._hours[0], minute=self._minutes[0])
 
     def _move_to_previous_hour(self, dt):
         """
@@ -527,26 +505,15 @@ class CronExpression(object):
         :param dt: Tested datetime
         :return: Previous hour for expression
         """
-        # test if current hour is in the set
-        if dt.hour in self._hours:
-            # if so use the index -1
-            index = self._hours.index(dt.hour) - 1
-        else:
-            # otherwise find the first entry in the set that is <= current hour
-            index = len(self._hours) - 1
-            while index > 0:
-                if self._hours[index] <= dt.hour:
-                    break
-                index -= 1
-        # get the hour from the list
-        h = self._hours[index]
-
-        # if the hour >= the current hour then move back to last event in previous day
-        if h >= dt.hour:
+        # number of hours in the sorted list before the current hour
+        index = bisect_left(self._hours, dt.hour)
+
+        # no earlier hour, move back to last event in previous day
+        if index == 0:
             return self._move_to_previous_day(dt)
-        else:
-            # previous event at same day
-            return dt.replace(hour=h, minute=max(self._minutes))
+
+        # previous event at same day
+        return dt.replace(hour=self._hours[index - 1], minute=self._minutes[-1])
 
     def _move_to_next_hour(self, dt):
         """
@@ -554,26 +521,15 @@ class CronExpression(object):
         :param dt: Tested datetime
         :return: Next hour for expression
         """
-        # test if current hour is in the set
-        if dt.hour in self._hours:
-            # if so used the index -1
-            index = (self._hours.index(dt.hour) + 1) % len(self._hours)
-        else:
-            # otherwise find the first entry in the set that is >= current hour
-            index = 0
-            while index < len(self._hours) - 1:
-                if self._hours[index] >= dt.hour:
-                    break
-                index += 1
-        # get the hour from the list
-        h = self._hours[index]
-
-        # if the hour <= the current hour then move to first event in next day
-        if h <= dt.hour:
+        # index of first hour in the sorted list after the current hour
+        index = bisect_right(self._hours, dt.hour)
+
+        # no later hour, move to first event in next day
+        if index == len(self._hours):
             return self._move_to_next_day(dt)
-        else:
-            # next event at same day
-            return dt.replace(hour=h, minute=min(self._minutes))
+
+        # next event at same day
+        return dt.replace(hour=self._hours[index], minute=self._minutes[0])
 
     def _move_to_previous_minute(self, dt):
         """
@@ -581,29 +537,15 @@ class CronExpression(object):
         :param dt: Tested datetime
         :return: Previous minute for expression
         """
-        # test if current minute is in the set
-        if dt.minute in self._minutes:
-            # use the index -1
-            index = self._minutes.index(dt.minute) - 1
-        else:
-            # otherwise find the index of the minute <= current minute
-            index = len(self._minutes) - 1
-            while index > 0:
-                if self._minutes[index] <= dt.minute:
-                    break
-                index -= 1
-
-        # get minute from the list
-        minute = self._minutes[index]
-
-        if minute >= dt.minute:
-            # if minute >= current minute then return last event in previous hour
+        # number of minutes in the sorted list before the current minute
+        index = bisect_left(self._minutes, dt.minute)
+
+        # no earlier minute, return last event in previous hour
+        if index == 0:
             return self._move_to_previous_hour(dt)
-        else:
-            # return previous event in same hour
-            return dt.replace(minute=minute)
 
-            # gets the last event in the previous minute in the set
+        # return previous event in same hour
+        return dt.replace(minute=self._minutes[index - 1])
 
     def _move_to_next_minute(self, dt):
         """
@@ -611,24 +553,12 @@ class CronExpression(object):
         :param dt: tested datetime
         :return: Next minute for expression
         """
-        # test if current minute is in the set
-        if dt.minute in self._minutes:
-            # use the index +1
-            index = (self._minutes.index(dt.minute) + 1) % len(self._minutes)
-        else:
-            # otherwise find the index of the minute <= current minute
-            index = 0
-            while index < len(self._minutes) - 1:
-                if self._minutes[index] >= dt.minute:
-                    break
-                index += 1
-
-        # get minute from the list
-        minute = self._minutes[index]
-
-        if minute <= dt.minute:
-            # if minute <= current minute then return first event in next hour
+        # index of first minute in the sorted list after the current minute
+        index = bisect_right(self._minutes, dt.minute)
+
+        # no later minute, return first event in next hour
+        if index == len(self._minutes):
             return self._move_to_next_hour(dt)
-        else:
-            # return next event in same hour
-            return dt.replace(minute=minute)
+
+        # return next event in same hour
+        return dt.replace(minute=self._minutes[index])
@@ -70,7 +70,7 @@ class SetBuilder(object):
             self._min_value = self._offset
             self._max_value = len(names) - 1 + self._offset
             # build list to identify values by their numeric string value
-            self._values = self.values = [str(i + self._offset) for i in range(0, len(self._names))]
+            self._values = self.values = tuple(str(i + self._offset) for i in range(0, len(self._names)))
 
         else:
             # setup builder with min and max values instead if names
@@ -95,6 +95,11 @@ class SetBuilder(object):
                 raise ValueError("offset parameter should not be used or have the same value as min_value")
             self._offset = min_value
 
+        # lookup sequences are not modified after construction
+        self._names = tuple(self._names)
+        self._values = tuple(self._values)
+        self._display_names = tuple(self._display_names)
+
         self._logging = logging.getLogger("SetBuilder")
 
         self._wrap = wrap
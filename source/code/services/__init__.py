@@ -11,13 +11,17 @@
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
 
+import glob
 import importlib
 import inspect
+import itertools
 import os
 import sys
-import uuid
-from os import listdir
-from os.path import isfile, join
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from os.path import basename, join
 
 import boto3
 import botocore.exceptions
@@ -36,10 +40,30 @@ SERVICES_PATH = "./" + SERVICES
 SERVICE = "Service"
 SERVICE_CLASS = "{}" + SERVICE
 
+SERVICE_FILES_PATTERN = join(SERVICES_PATH, "*_" + SERVICE.lower() + ".py")
+
 ENV_ROLE_ARN = "ROLE_ARN"
+ENV_PRELOAD_SERVICES = "OPS_AUTOMATOR_PRELOAD"
+
+PRELOAD_WORKERS = 4
+
+# assumed role credentials are reused until they are this close to their expiration
+ROLE_CREDENTIALS_MARGIN = timedelta(minutes=5)
 
 __services = {}
 
+# role session names only need to be unique within this process
+_session_counter = itertools.count()
+_session_prefix = "{}-{}".format(os.getpid(), int(time.time()))
+
+# sts client for the default credentials, all roles are assumed with this client
+_sts_client = None
+_sts_client_lock = threading.Lock()
+
+# credentials for assumed roles by role arn, the roles are always assumed with the shared sts client so the arn identifies the
+# credentials
+_role_credentials = {}
+
 
 def _get_service_class(service_module):
     """
@@ -66,6 +90,32 @@ def _get_module(module_name):
     return the_module
 
 
+def _service_module_names():
+    """
+    Returns the names of all modules in the services package that implement a service
+    :return: names of the service modules
+    """
+    for path in glob.iglob(SERVICE_FILES_PATTERN):
+        yield SERVICE_MODULE_NAME.format(basename(path)[0:-len(".py")])
+
+
+def _preload_module(module_name):
+    try:
+        _get_module(module_name)
+    except ImportError:
+        # error is raised again when the service is actually used
+        pass
+
+
+def preload_all():
+    """
+    Imports all service modules using a small pool of threads, the reads of the module files and compiled code overlap
+    :return:
+    """
+    with ThreadPoolExecutor(max_workers=PRELOAD_WORKERS) as executor:
+        list(executor.map(_preload_module, _service_module_names()))
+
+
 def get_module_for_service(service_name):
     """
     Gets the module for a service using naming convention. First the name of the service is capitalized and appended by the
@@ -90,15 +140,13 @@ def all_services():
     :return: list of all supported service names
     """
     result = []
-    for f in listdir(SERVICES_PATH):
-        if isfile(join(SERVICES_PATH, f)) and f.endswith("_{}.py".format(SERVICE.lower())):
-            module_name = SERVICE_MODULE_NAME.format(f[0:-len(".py")])
-            service_module = _get_module(module_name)
-            cls = _get_service_class(service_module)
-            if cls is not None:
-                service_name = cls[0][0:-len(SERVICE)]
-                if service_name.lower() != "aws":
-                    result.append(service_name)
+    for module_name in _service_module_names():
+        service_module = _get_module(module_name)
+        cls = _get_service_class(service_module)
+        if cls is not None:
+            service_name = cls[0][0:-len(SERVICE)]
+            if service_name.lower() != "aws":
+                result.append(service_name)
     return result
 
 
@@ -165,30 +213,63 @@ def account_from_role_arn(role_arn):
     :param role_arn: The arn
     :return: The extracted account number
     """
-    role_elements = role_arn.split(":")
+    role_elements = role_arn.split(":", 5)
     if len(role_elements) < 5:
         raise ValueError("Role \"%s\" is not a valid role arn", role_arn)
     return role_elements[4]
 
 
-def get_session(role_arn=None, sts_client=None, logger=None):
-    if role_arn not in [None, ""]:
-        sts = sts_client if sts_client is not None else boto3.client("sts")
+def get_sts_client():
+    """
+    Returns the sts client for the default credentials, shared by all callers in the process
+    :return: Sts client
+    """
+    global _sts_client
+    with _sts_client_lock:
+        if _sts_client is None:
+            _sts_client = boto3.client("sts")
+    return _sts_client
+
+
+def _assume_role(role_arn, account, logger):
+    credentials = _role_credentials.get(role_arn)
+    if credentials is not None:
+        expiration = credentials["Expiration"]
+        if expiration - ROLE_CREDENTIALS_MARGIN > datetime.now(expiration.tzinfo):
+            return credentials
+
+    if account is None:
         account = account_from_role_arn(role_arn)
-        try:
-            token = sts.assume_role(RoleArn=role_arn, RoleSessionName="{}-{}".format(account, str(uuid.uuid4())))
-        except botocore.exceptions.ClientError as ex:
-            if logger is not None:
-                logger.error(ERR_ASSUME_ROLE_FOR_ARN, role_arn, ex)
-            raise ex
-        credentials = token["Credentials"]
+    try:
+        token = get_sts_client().assume_role(RoleArn=role_arn,
+                                             RoleSessionName="{}-{}-{}".format(account, _session_prefix, next(_session_counter)))
+    except botocore.exceptions.ClientError as ex:
+        if logger is not None:
+            logger.error(ERR_ASSUME_ROLE_FOR_ARN, role_arn, ex)
+        raise ex
+    credentials = token["Credentials"]
+    _role_credentials[role_arn] = credentials
+    return credentials
+
+
+def get_session(role_arn=None, logger=None, account=None):
+    """
+    Returns a boto3 session, using credentials of the assumed role if a role is specified. Roles are assumed with the shared sts
+    client for the default credentials, see get_sts_client, and the credentials are reused until they are about to expire
+    :param role_arn: Arn of the role to assume
+    :param logger: Optional logger for errors
+    :param account: Account of the role, if not specified it is taken from the role arn
+    :return: boto3 session
+    """
+    if role_arn not in [None, ""]:
+        credentials = _assume_role(role_arn, account, logger)
         return boto3.Session(aws_access_key_id=credentials["AccessKeyId"],
                              aws_secret_access_key=credentials["SecretAccessKey"],
                              aws_session_token=credentials["SessionToken"])
     else:
         role = os.getenv(ENV_ROLE_ARN)
         if role is not None:
-            return get_session(role, sts_client)
+            return get_session(role)
         return boto3.Session()
 
 
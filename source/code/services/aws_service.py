@@ -11,11 +11,17 @@
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
 
+import copy
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
 import boto3
+import botocore.config
 import botocore.exceptions
-import jmespath
 
 import boto_retry
 import services
@@ -26,20 +32,110 @@ ERR_UNEXPECTED_MULTIPLE_RESULTS = "Requested a single resource result but there
 ERR_NO_BOTO_SERVICE_METHOD = "Service client for service \"{}\" has no method named \"{}\""
 
 DEFAULT_NEXT_TOKEN = "NextToken"
+DEFAULT_PAGE_SIZE_ARGUMENT = "MaxResults"
+
+# page size used by get() to detect a single resource, raised to the minimum page size of resources that need a larger page
+GET_PAGE_SIZE = 2
+
+ENV_MAX_POOL_CONNECTIONS = "AWS_MAX_POOL_CONNECTIONS"
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+# shared by all service clients, retries are handled by the service retry strategies
+_CLIENT_CONFIG = botocore.config.Config(
+    max_pool_connections=int(os.getenv(ENV_MAX_POOL_CONNECTIONS, DEFAULT_MAX_POOL_CONNECTIONS)),
+    tcp_keepalive=True)
+
+# marks a missing value
+_SENTINEL = object()
+
+# threads shared by all service instances to retrieve the next page while the current page is processed
+PREFETCH_WORKERS = 4
+_prefetch_executor = None
+
+# identity of the default credentials, which are used by the sts client of all service instances
+_default_caller_identity = None
 
 SERVICES_SUPPORTED_BY_RESOURCEGROUP_TAGGING_API = [
+    "dynamodb",
     "elasticache",
     "ec2",
     "elb",
     "emr",
     "glacier",
     "kinesis",
+    "lambda",
     "rds",
     "route53",
     "s3",
     "storagegateway"
 ]
 
+# position before every character in a camel case name that starts a new snake case word
+_CAMEL_SPLIT = re.compile(r"(?<!^)(?=[^a-z_])")
+# underscore and the character that follows it in a snake case name
+_SNAKE_SPLIT = re.compile(r"_(.)")
+# JMES path expressions that select a single attribute
+_SIMPLE_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_ROLE_ARN = re.compile(r"^arn:aws:iam::\d{12}:role/")
+
+# compiled JMES path expressions
+_JMES_CACHE = {}
+
+# names of the boto3 methods by service class and resource name, the name only depends on the resource name so it can be
+# shared by all instances of a service class
+_DESCRIBE_FUNC_NAMES = {}
+
+
+def _compiled(expression):
+    compiled = _JMES_CACHE.get(expression)
+    if compiled is None:
+        # only needed for result paths and selects that are not a single attribute
+        import jmespath
+        compiled = jmespath.compile(expression)
+        _JMES_CACHE[expression] = compiled
+    return compiled
+
+
+@lru_cache(maxsize=None)
+def _is_simple_key(expression):
+    # a single attribute name can be read from the response without using JMESPath
+    return _SIMPLE_KEY.fullmatch(expression) is not None
+
+
+def _get_default_caller_identity(sts_client):
+    global _default_caller_identity
+    if _default_caller_identity is None:
+        _default_caller_identity = sts_client.get_caller_identity()
+    return _default_caller_identity
+
+
+@lru_cache(maxsize=None)
+def available_regions(service_name):
+    """
+    Returns the regions in which a service is available, regions are taken from the endpoint data of botocore and do not
+    depend on the credentials of the session
+    :param service_name: Name of the service
+    :return: Tuple with the names of the regions
+    """
+    return tuple(boto3.Session().get_available_regions(service_name=service_name))
+
+
+def _get_prefetch_executor():
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+    return _prefetch_executor
+
+
+@lru_cache(maxsize=None)
+def _camel_to_snake_case(name):
+    return _CAMEL_SPLIT.sub("_", name).lower()
+
+
+@lru_cache(maxsize=None)
+def _snake_to_camel_case(name):
+    return _SNAKE_SPLIT.sub(lambda m: m.group(1).upper(), name.strip("_").capitalize())
+
 
 class AwsService(object):
     """
@@ -57,6 +153,8 @@ class AwsService(object):
                  mapped_parameters=None,
                  next_token_result=None,
                  next_token_argument=None,
+                 page_sizes=None,
+                 min_page_sizes=None,
                  service_retry_strategy=None):
         """
         :param service_name: Name of the service
@@ -72,10 +170,21 @@ class AwsService(object):
         results
         :param next_token_argument: Name of the parameter to pass the next token value from a previous "describe" call as a
         starting point to retrieve remaining results
+        :param page_sizes: Dictionary with the number of resources to request per "describe" call for resources, used if the
+        caller did not specify a page size
+        :param min_page_sizes: Dictionary with the minimum number of resources that can be requested per "describe" call for
+        resources with a page size, for resources that are not in the dictionary the minimum is 1
         :param service_retry_strategy: service retry strategy for making boto api calls
         """
 
+        # clients for the service by region and the most recently used client
+        self._service_clients = {}
         self._service_client = None
+        # names of the methods that are wrapped with retry logic by region
+        self._wrapped_methods = {}
+        # guards creating clients and wrapping their methods, shared with the copies made by describe_many
+        self._service_client_lock = threading.Lock()
+        self._default_region = None
         self._assumed_role = None
 
         # use session, role or none (non used default session)
@@ -88,8 +197,15 @@ class AwsService(object):
         self.service_name = service_name
         # used to retrieve resources without case sensitivity
         self._resource_names = {name.lower(): name for name in resource_names}
+        # normalized names for resource names passed to describe and get calls, prefilled with the common spellings
+        self._resource_name_cache = {}
+        for name in resource_names:
+            for spelling in (name, name.lower(), _camel_to_snake_case(name)):
+                self._resource_name_cache[spelling] = name
         # resources that have tags
-        self._resources_with_tags = resources_with_tags
+        # set for membership tests, list keeps the order of the resources for the resources_with_tags property
+        self._resources_with_tags = frozenset(resources_with_tags) if resources_with_tags is not None else None
+        self._resources_with_tags_list = list(resources_with_tags) if resources_with_tags else []
 
         self._as_tuple = as_named_tuple
         self._tags_as_dict = tags_as_dict
@@ -97,7 +213,7 @@ class AwsService(object):
         # attributes are excluded from implicit conversion to named tuples
         self._tuple_excludes = ["Tags"]
         # attribute names for tags that will be converted to dictionaries
-        self._converted_tags = ["Tags"]
+        self._converted_tags = ("Tags",)
 
         # default continuation parameter and result attribute
         self._nexttoken_result = next_token_result if next_token_result is not None else DEFAULT_NEXT_TOKEN
@@ -107,6 +223,10 @@ class AwsService(object):
         self._custom_result_paths = custom_result_paths if custom_result_paths is not None else {}
         # default translated parameters
         self._mapped = mapped_parameters if mapped_parameters is not None else {}
+        self._mapped_items = tuple(self._mapped.items())
+        # default page sizes for resources
+        self._page_size_per_resource = page_sizes if page_sizes is not None else {}
+        self._min_page_size_per_resource = min_page_sizes if min_page_sizes is not None else {}
 
         self._sts_client = None
         self._aws_account = None
@@ -123,6 +243,7 @@ class AwsService(object):
         self._use_cached_tags = None
         self._cached_tags_region = None
         self._cached_tags_session = None
+        self._tagging_api_denied = False
         self._tag_roles = []
         self._tags = None
 
@@ -142,18 +263,17 @@ class AwsService(object):
         :return: Session
         """
         if self._session is None:
-            self._session = services.get_session(role_arn=self.role_arn,
-                                                 sts_client=self.sts_client if self.role_arn not in [None, ""] else None)
+            self._session = services.get_session(role_arn=self.role_arn)
         return self._session
 
     @property
     def sts_client(self):
         """
-        Returns a (cached) sts client
+        Returns the sts client for the default credentials, shared by all service instances
         :return: Sts client
         """
         if self._sts_client is None:
-            self._sts_client = boto3.client("sts")
+            self._sts_client = services.get_sts_client()
         return self._sts_client
 
     def service_regions(self):
@@ -161,7 +281,7 @@ class AwsService(object):
         Returns all regions in which a service is available
         :return:  all regions in which the service is available
         """
-        return services.get_session().get_available_regions(service_name=self.service_name)
+        return list(available_regions(self.service_name))
 
     def service_client(self, region=None, method_names=None):
         """
@@ -172,24 +292,58 @@ class AwsService(object):
         """
 
         if region is None:
-            region = boto3.client(self.service_name).meta.config.region_name
-
-        if self._service_client is None or self._service_client.meta.config.region_name != region:
-            args = {
-                "service_name": self.service_name,
-                "region_name": region
-            }
-
-            used_session = self._session if self._session is not None else services.get_session(self.role_arn)
-            self._service_client = used_session.client(**args)
-
-        if self._service_retry_strategy is not None and method_names is not None:
-            for method_name in method_names:
-                if getattr(self._service_client, method_name + boto_retry.DEFAULT_SUFFIX, None) is None:
-                    boto_retry.make_method_with_retries(boto_client_or_resource=self._service_client, name=method_name,
+            if self._default_region is None:
+                self._default_region = boto3.client(self.service_name).meta.config.region_name
+            region = self._default_region
+
+        with self._service_client_lock:
+            client = self._service_clients.get(region)
+            if client is None:
+                args = {
+                    "service_name": self.service_name,
+                    "region_name": region,
+                    "config": _CLIENT_CONFIG
+                }
+
+                # the cached session assumes the role once, using the cached sts client of this instance
+                client = self.session.client(**args)
+                self._service_clients[region] = client
+                self._wrapped_methods[region] = set()
+
+            if self._service_retry_strategy is not None and method_names is not None:
+                wrapped_methods = self._wrapped_methods[region]
+                for method_name in method_names:
+                    if method_name in wrapped_methods:
+                        continue
+                    if getattr(client, method_name + boto_retry.DEFAULT_SUFFIX, None) is None:
+                        boto_retry.make_method_with_retries(boto_client_or_resource=client, name=method_name,
+                                                            service_retry_strategy=self._service_retry_strategy)
+                    wrapped_methods.add(method_name)
+
+        self._service_client = client
+        return client
+
+    def _client_method_with_retries(self, client, name):
+        """
+        Returns a method of a client, wrapped with the retry logic of the service retry strategy if the instance has a strategy
+        :param client: Client of the service
+        :param name: Name of the boto3 client method
+        :return: Method that can be called with the arguments of the boto3 client method
+        """
+        if self._service_retry_strategy is None:
+            return getattr(client, name)
+
+        with self._service_client_lock:
+            # wrapped methods are only recorded for the clients that are cached by service_client
+            region = client.meta.region_name
+            wrapped_methods = self._wrapped_methods.get(region) if self._service_clients.get(region) is client else None
+            if wrapped_methods is None or name not in wrapped_methods:
+                if getattr(client, name + boto_retry.DEFAULT_SUFFIX, None) is None:
+                    boto_retry.make_method_with_retries(boto_client_or_resource=client, name=name,
                                                         service_retry_strategy=self._service_retry_strategy)
-
-        return self._service_client
+                if wrapped_methods is not None:
+                    wrapped_methods.add(name)
+        return getattr(client, name + boto_retry.DEFAULT_SUFFIX)
 
     @property
     def aws_account(self):
@@ -202,7 +356,7 @@ class AwsService(object):
             if self.role_arn not in [None, ""]:
                 self._aws_account = services.account_from_role_arn(self.role_arn)
             else:
-                self._aws_account = services.get_aws_account(self.sts_client)
+                self._aws_account = _get_default_caller_identity(self.sts_client)["Account"]
 
         return self._aws_account
 
@@ -215,8 +369,8 @@ class AwsService(object):
         if self.role_arn is not None:
             return self.role_arn
         if self._assumed_role is None:
-            arn = self.sts_client.get_caller_identity()["Arn"]
-            if re.match("^arn:aws:iam::\\d{12}:role/", arn):
+            arn = _get_default_caller_identity(self.sts_client)["Arn"]
+            if _ROLE_ARN.match(arn):
                 self._assumed_role = "/".join(
                     arn.replace("arn:aws:sts::", "arn:aws:iam::").replace(":assumed-role/", ":role/").split("/")[0:-1])
         return self._assumed_role
@@ -228,12 +382,18 @@ class AwsService(object):
         exception if there is no resource with that name in the service
         :return: Normalized resource name
         """
+        name = self._resource_name_cache.get(resource_name)
+        if name is not None:
+            return name
+
         parts = resource_name.split('_')
         name = "".join(part[0].upper() + part[1:] for part in parts)
         if name.lower() not in self._resource_names:
             raise ValueError("{} is not a valid resource for service {}, valid resources are {}".format(
                 resource_name, self.service_name, ", ".join(sorted(self.resources))))
-        return self._resource_names[name.lower()]
+        name = self._resource_names[name.lower()]
+        self._resource_name_cache[resource_name] = name
+        return name
 
     def describe_resources_function_name(self, resource_name):
         """
@@ -243,8 +403,7 @@ class AwsService(object):
         :return: Name of the boto3 client function to retrieve the specified resource type
         """
         # assume describe_<resource_name> as a default
-        return "describe_" + resource_name[0].lower() + "".join(
-            [i if i.islower() or i == "_" else "_" + i.lower() for i in resource_name[1:]])
+        return "describe_" + _camel_to_snake_case(resource_name)
 
     def required_describe_resource_permissions(self, resource_name):
         """
@@ -255,31 +414,17 @@ class AwsService(object):
         :return:
         """
 
-        def snake_to_camel_case(s):
-            result = ""
-            s = s.strip("_").capitalize()
-            i = 0
-
-            while i < len(s):
-                if s[i] == "_":
-                    i += 1
-                    result += s[i].upper()
-                else:
-                    result += s[i]
-                i += 1
-
-            return result
-
         if not resource_name:
             return []
 
-        permissions = ["{}:{}".format(self.service_name, snake_to_camel_case(self.describe_resources_function_name(resource_name)))]
+        describe_function_name = _snake_to_camel_case(self.describe_resources_function_name(resource_name))
+        permissions = ["{}:{}".format(self.service_name, describe_function_name)]
 
         # need to retrieve tags in an explicit call?
-        if resource_name in self.resources_with_tags:
+        if self._resources_with_tags and resource_name in self._resources_with_tags:
             tagging_resource_name = self._get_tag_resource()
             if tagging_resource_name:
-                get_tags_function_name = snake_to_camel_case(self.describe_resources_function_name(tagging_resource_name))
+                get_tags_function_name = _snake_to_camel_case(self.describe_resources_function_name(tagging_resource_name))
                 permissions.append("{}:{}".format(self.service_name, get_tags_function_name))
 
         return permissions
@@ -302,6 +447,17 @@ class AwsService(object):
        """
         return self._nexttoken_result
 
+    def _page_size_argument_name(self, resources, args):
+        """
+        Returns the name of the parameter to set the number of resources returned by a describe call for a specific resource. The
+        name is mapped like the other describe parameters. Overwrite in inherited service classes for resources that use
+        another parameter or that do not allow a page size in combination with the other parameters in args.
+        :param resources: Name of the resource type
+        :param args: Parameters passed to the describe call
+        :return: Name of the page size parameter, None if no page size must be set
+        """
+        return DEFAULT_PAGE_SIZE_ARGUMENT
+
     def _map_describe_function_parameters(self, resources, args):
         """
         Maps the parameter names passed to the service class describe call to names used to make the call the the boto
@@ -311,14 +467,14 @@ class AwsService(object):
         :return: mapped parameters
         """
 
-        if len(self._mapped) == 0:
+        if not self._mapped_items:
             return args
 
         mapped_args = args.copy()
-        for arg in self._mapped:
-            if arg in mapped_args:
-                mapped_args[self._mapped[arg]] = args[arg]
-                del mapped_args[arg]
+        for arg, mapped_arg in self._mapped_items:
+            value = mapped_args.pop(arg, _SENTINEL)
+            if value is not _SENTINEL:
+                mapped_args[mapped_arg] = value
 
         return mapped_args
 
@@ -343,7 +499,10 @@ class AwsService(object):
         else:
             expression = self._custom_result_paths.get(self._resource_name, self._resource_name)
         if expression != "":
-            resources = jmespath.search(expression, resp)
+            if isinstance(resp, dict) and _is_simple_key(expression):
+                resources = resp.get(expression)
+            else:
+                resources = _compiled(expression).search(resp)
         else:
             resources = resp
 
@@ -361,10 +520,33 @@ class AwsService(object):
         """
         if self._tags_as_dict:
             for t in self._converted_tags:
-                if t in resource:
-                    tags = resource.get(t, []) or []
-                    resource[t] = tags if isinstance(tags, dict) else {tag["Key"].strip(): tag.get("Value", "").strip() for tag in
-                                                                       tags}
+                tags = resource.get(t, _SENTINEL)
+                if tags is not _SENTINEL and not isinstance(tags, dict):
+                    resource[t] = self._tag_list_as_dict(tags or ())
+
+    @staticmethod
+    def _tag_list_as_dict(tags, key="Key", value="Value"):
+        """
+        Converts a list of tags into a python dictionary, a tag without a value gets an empty value
+        :param tags: List of tags
+        :param key: Name of the attribute of a tag that holds its key
+        :param value: Name of the attribute of a tag that holds its value
+        :return: Dictionary with the tags
+        """
+        return {tag[key].strip(): tag.get(value, "").strip() for tag in tags}
+
+    def _tags_from_list(self, tags, key="Key", value="Value"):
+        """
+        Returns tags retrieved by an additional call in the format returned by the describe call. Tags are returned as a
+        dictionary if tags are requested as dictionaries, which makes converting them afterwards unnecessary
+        :param tags: List of tags
+        :param key: Name of the attribute of a tag that holds its key
+        :param value: Name of the attribute of a tag that holds its value
+        :return: Dictionary or list of Key/Value dictionaries with the tags
+        """
+        if self._tags_as_dict:
+            return self._tag_list_as_dict(tags, key, value)
+        return [{"Key": tag[key], "Value": tag.get(value, "")} for tag in tags]
 
     def _get_tags_for_resource(self, client, resource):
         """
@@ -376,6 +558,15 @@ class AwsService(object):
         """
         return resource.get("Tags", {})
 
+    def _prefetch_tags_for_resources(self, client, resources):
+        """
+        Called with all resources of a page before their tags are retrieved by _get_tags_for_resource. Overwrite in inherited
+        services that can retrieve the tags for multiple resources in a single call.
+        :param client: Client that can be used to make the boto call to retrieve the tags
+        :param resources: The resources of the page
+        """
+        pass
+
     def _get_tag_resource(self):
         """
         Returns the name of the service/resource specific resource that is used to explicitly retrieve the tags for that
@@ -402,8 +593,8 @@ class AwsService(object):
             if resource.get("Tags", None) is None:
                 resource["Tags"] = self._get_tags_for_resource(client, resource)
 
-        # convert tags to dictionaries
-        if self._tags_as_dict and not isinstance(resource.get("Tags", {}), dict):
+        # convert tags to dictionaries, tags that already are dictionaries are skipped by the conversion
+        if self._tags_as_dict:
             self._convert_tags_to_dictionaries(resource)
 
         # convert resource to named tuple
@@ -418,7 +609,8 @@ class AwsService(object):
         return False
 
     def describe(self, service_resource, region=None, tags=False, tags_as_dict=None, as_tuple=None,
-                 select=None, filter_func=None, context=None, select_on_tag=None, tag_roles=None, **describe_args):
+                 select=None, filter_func=None, context=None, select_on_tag=None, tag_roles=None, page_size=None,
+                 prefetch=False, **describe_args):
         """
         This method is used to retrieve service resources, specified by their name, from a service
         :param filter_func: function for additional filtering of resources
@@ -431,6 +623,9 @@ class AwsService(object):
         :param select_on_tag: only include resources that have a tag with this name
         :param tag_roles: optional roles used to assume to select tags for a resource as this may be required by shared resources
         from another account
+        :param page_size: Number of resources to request per "describe" call, if None the default for the resource is used
+        :param prefetch: Set to True to request the next page in a background thread while the resources of the current page
+        are returned
         :param describe_args: Parameters passed to the boto "describe" function
         :param context: Lambda context
         :return: Service resources of the specified resource type for the service.
@@ -453,7 +648,20 @@ class AwsService(object):
         # normalize resource name
         self._resource_name = self._get_resource_name(service_resource)
         # get the name of the boto3 method to retrieve this resource type
-        describe_func_name = self.describe_resources_function_name(self._resource_name)
+        describe_func_key = (type(self), self._resource_name)
+        describe_func_name = _DESCRIBE_FUNC_NAMES.get(describe_func_key)
+        if describe_func_name is None:
+            describe_func_name = self.describe_resources_function_name(self._resource_name)
+            _DESCRIBE_FUNC_NAMES[describe_func_key] = describe_func_name
+
+        # request the configured number of resources per call if the caller did not set it
+        if page_size is None:
+            page_size = self._page_size_per_resource.get(self._resource_name)
+        if page_size is not None:
+            page_size_argument = self._page_size_argument_name(self._resource_name, describe_args)
+            if page_size_argument is not None and page_size_argument not in describe_args:
+                describe_args = dict(describe_args)
+                describe_args[page_size_argument] = page_size
 
         # get additional parameters for boto describe method and map parameter names
         if describe_args is None:
@@ -468,6 +676,12 @@ class AwsService(object):
         else:
             method_names = None
 
+        # exceptions that end the describe call without raising them, the retry logic removes these from the call arguments
+        expected_exceptions = frozenset(describe_args.get(boto_retry.EXPECTED_EXCEPTIONS, ()))
+        if method_names is None and boto_retry.EXPECTED_EXCEPTIONS in function_args:
+            function_args = dict(function_args)
+            del function_args[boto_retry.EXPECTED_EXCEPTIONS]
+
         client = self.service_client(region=region, method_names=method_names)
         describe_func = getattr(client, describe_func_name, None)
         if describe_func is None:
@@ -485,52 +699,162 @@ class AwsService(object):
         self._tag_roles = tag_roles
         self._context = context
 
+        # values that are the same for all returned resources
+        region_name = client.meta.region_name if self.is_regional() else None
+        account = None
+        resource_name = self._resource_name
+
+        # methods called for every page
+        extract_resources = self._extract_resources
+        transform_page = self._transform_page
+        set_continuation_call_parameters = self.set_continuation_call_parameters
+
+        next_page = None
         done = False
-        while not done:
+        try:
+            while not done:
 
-            # call boto method to retrieve until no more resources are retrieved
-            try:
-                resp = describe_func(**function_args)
-            except Exception as ex:
-                expected_exceptions = describe_args.get(boto_retry.EXPECTED_EXCEPTIONS, [])
-                if type(ex).__name__ in expected_exceptions or getattr(ex, "response", {}).get("Error", {}) \
-                        .get("Code", "") in expected_exceptions:
-                    done = True
-                    continue
+                # call boto method to retrieve until no more resources are retrieved
+                try:
+                    resp = next_page.result() if next_page is not None else describe_func(**function_args)
+                except Exception as ex:
+                    if type(ex).__name__ in expected_exceptions or getattr(ex, "response", {}).get("Error", {}) \
+                            .get("Code", "") in expected_exceptions:
+                        done = True
+                        continue
+                    else:
+                        raise ex
+                next_page = None
+
+                # if there are set the continuation token parameter for the next call to the value of the results continuation
+                # token test if more resources are available
+                if resp.get(next_token):
+                    set_continuation_call_parameters(function_args, next_token, resp)
+                    if prefetch:
+                        next_page = _get_prefetch_executor().submit(describe_func, **function_args)
                 else:
-                    raise ex
+                    # all resources retrieved
+                    done = True
 
-            # extract resources from result and transform to requested output format
-            resources_data = self._extract_resources(resp=resp, select=select)
-            self._use_cached_tags = self.__class__.use_cached_tags(self._resource_name, len(resources_data))
-
-            for obj in resources_data:
-                if filter_func is not None and not filter_func(obj):
-                    continue
-                # annotate additional account and region attributes
-                obj["AwsAccount"] = self.aws_account
-                obj["Region"] = self.service_client(region).meta.region_name if self.is_regional() else None
-                obj["Service"] = self.service_name
-                obj["ResourceTypeName"] = self._resource_name
-
-                # yield the transformed resource
-                transformed = self._transform_returned_resource(self.service_client(region=region), resource=obj)
-
-                if select_on_tag is None or select_on_tag in transformed.get("Tags", {}):
-                    yield transformed
-
-            # if there are set the continuation token parameter for the next call to the value of the results continuation token
-            # test if more resources are available
-            if next_token in resp and resp[next_token] not in ["", False, None]:
-                self.set_continuation_call_parameters(function_args, next_token, resp)
-            else:
-                # all resources retrieved
-                done = True
+                # extract resources from result and transform to requested output format
+                resources_data = extract_resources(resp=resp, select=select)
+                self._use_cached_tags = self.__class__.use_cached_tags(resource_name, len(resources_data))
+
+                if resources_data:
+                    if account is None:
+                        account = self.aws_account
+                    # yield the transformed resources
+                    yield from transform_page(client, resources_data, account, region_name, filter_func, select_on_tag)
+        finally:
+            # caller stopped reading the resources before the last page
+            if next_page is not None:
+                next_page.cancel()
+
+    def _transform_page(self, client, resources, account, region, filter_func=None, select_on_tag=None):
+        """
+        Annotates and transforms the resources from a single response of the boto "describe" call
+        :param client: boto client for the service
+        :param resources: Resources extracted from the response
+        :param account: Account of the resources
+        :param region: Region of the resources, None for global services
+        :param filter_func: function for additional filtering of resources
+        :param select_on_tag: only include resources that have a tag with this name
+        :return: List of transformed resources
+        """
+        result = []
+        append = result.append
+        transform_returned_resource = self._transform_returned_resource
+
+        # additional account and region attributes, the same for all resources of the page
+        annotation = {
+            "AwsAccount": account,
+            "Region": region,
+            "Service": self.service_name,
+            "ResourceTypeName": self._resource_name
+        }
+
+        if filter_func is not None:
+            resources = [obj for obj in resources if filter_func(obj)]
+
+        if self._tags and resources:
+            self._prefetch_tags_for_resources(client, resources)
+
+        for obj in resources:
+            obj.update(annotation)
+
+            transformed = transform_returned_resource(client, resource=obj)
+
+            if select_on_tag is None:
+                append(transformed)
+                continue
+
+            tags = transformed.get("Tags")
+            if tags:
+                if isinstance(tags, dict):
+                    if select_on_tag in tags:
+                        append(transformed)
+                # tags in their original Key/Value format
+                elif any(tag.get("Key") == select_on_tag for tag in tags):
+                    append(transformed)
+
+        return result
 
     def set_continuation_call_parameters(self, function_args, next_token, resp):
         next_token_argument = self._next_token_argument_name(self._resource_name)
         function_args[next_token_argument] = resp[next_token]
 
+    def describe_many(self, requests, region=None, max_workers=1, **describe_args):
+        """
+        Retrieves multiple resource types from a service. All describe calls share the cached client for their region and the
+        cached account of the service class instance.
+        When max_workers is greater than 1 every request is described by a shallow copy of the instance in its own thread, as
+        describe keeps the state of the running call in the instance. The copies share all containers of the instance: the
+        clients and wrapped methods by region, which are only changed while holding the lock that is shared as well, the
+        session, the cached account and the normalized resource names. Inherited services that keep other caches in the
+        instance must guard changes to these with the same lock, see RdsService.
+        :param requests: Iterable of (service_resource, describe_args) tuples, the describe_args for a resource are added to
+        the describe_args for all resources and can set the region for a request
+        :param region: Region from where resources are retrieved, if None then the current region is used
+        :param max_workers: Maximum number of resource types that are retrieved in parallel threads
+        :param describe_args: Parameters passed to the describe method for all resources
+        :return: Tuples of the name of the service resource and a list of the resources of that type, in the order of the requests
+        """
+
+        def request_args(resource_args):
+            args = dict(describe_args)
+            args["region"] = region
+            if resource_args:
+                args.update(resource_args)
+            return args
+
+        def describe_resources(service, service_resource, resource_args):
+            return service_resource, list(service.describe(service_resource, **request_args(resource_args)))
+
+        if max_workers <= 1:
+            for request in requests:
+                yield describe_resources(self, *request)
+            return
+
+        requests = list(requests)
+        if not requests:
+            return
+
+        # create the clients, session and account before the threads start so all copies of this instance share them
+        for request_region in set(request_args(request[1])["region"] for request in requests):
+            self.service_client(region=request_region)
+        _ = self.aws_account
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            # every request uses a shallow copy of this instance that shares its clients, session and cached account
+            futures = [executor.submit(describe_resources, copy.copy(self), *request) for request in requests]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                # caller stopped reading the results or a request failed
+                for future in futures:
+                    future.cancel()
+
     def get(self, service_resource, region=None, tags_as_dict=None, tags=False, as_tuple=None, select_on_tag=None, select=None,
             tag_roles=None, **describe_args):
         """
@@ -549,6 +873,14 @@ class AwsService(object):
         :return: Service resource of the specified resource type for the service, None if the resource was not available.
         """
 
+        # a small page is enough to test if there is more than one resource, unless resources are filtered, in which case
+        # small pages could only add calls to find the resource
+        page_size = None
+        resource_name = self._get_resource_name(service_resource)
+        if select is None and select_on_tag is None and "Filters" not in describe_args and \
+                resource_name in self._page_size_per_resource:
+            page_size = max(GET_PAGE_SIZE, self._min_page_size_per_resource.get(resource_name, 1))
+
         # get resources
         results = self.describe(service_resource=service_resource,
                                 region=region,
@@ -558,20 +890,20 @@ class AwsService(object):
                                 select=select,
                                 select_on_tag=select_on_tag,
                                 tag_roles=tag_roles,
+                                page_size=page_size,
                                 **describe_args)
 
         try:
-            # get the first returned resource
-            result = next(results)
-            try:
-                # if there is more than one result, raise Exception
-                next(results)
-                raise_exception(ERR_UNEXPECTED_MULTIPLE_RESULTS)
-            except StopIteration:
-                # Expected exception as there should be only one result
-                return result
-        except StopIteration:
+            # get up to two resources, a second resource means the result is not unique
+            first_results = list(islice(results, 2))
+        finally:
+            results.close()
+
+        if not first_results:
             return None
+        if len(first_results) > 1:
+            raise_exception(ERR_UNEXPECTED_MULTIPLE_RESULTS)
+        return first_results[0]
 
     @property
     def resources(self):
@@ -583,7 +915,7 @@ class AwsService(object):
 
     @property
     def resources_with_tags(self):
-        return self._resources_with_tags if self._resources_with_tags else []
+        return self._resources_with_tags_list
 
     @property
     def resource_method_mapping(self):
@@ -625,7 +957,27 @@ class AwsService(object):
                 except botocore.exceptions.ClientError as ex:
                     if getattr(ex, "response", {}).get("Error", {}).get("Code", "") == "InvalidParameterValue":
                         break
+                    raise ex
 
             self._cached_tags_region = region
             self._cached_tags_session = session
         return self._cached_tags
+
+    def cached_tags_for_resource(self, arn, resource_name, region=None):
+        """
+        Returns the tags of a resource from the tags cached using the resource groups tagging api
+        :param arn: Arn of the resource
+        :param resource_name: Resource type used in the tagging api resource type filter
+        :param region: Region of the resource
+        :return: Tags of the resource, None if the role is not allowed to use the tagging api, roles created before the
+        service was supported by the tagging api do not have that permission
+        """
+        if self._tagging_api_denied:
+            return None
+        try:
+            return self.cached_tags(resource_name=resource_name, region=region).get(arn, [])
+        except botocore.exceptions.ClientError as ex:
+            if getattr(ex, "response", {}).get("Error", {}).get("Code", "") not in ["AccessDenied", "AccessDeniedException"]:
+                raise ex
+            self._tagging_api_denied = True
+            return None
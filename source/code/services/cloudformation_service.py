@@ -34,21 +34,10 @@ CUSTOM_RESULT_PATHS = {
     STACKS_SUMMARY: "StackSummaries",
     STACK_LIST: "StackSummaries",
     STACK_POLICY: "{StackPolicy:StackPolicyBody}",
-    TEMPLATE: "{" + ",".join(['"{}":{}'.format(i, i) for i in [
-        "TemplateBody",
-        "StagesAvailable",
-
-    ]]) + "}",
-    TEMPLATE_SUMMARY: "{" + ",".join(['"{}":{}'.format(i, i) for i in [
-        "Parameters",
-        "Description",
-        "Capabilities",
-        "CapabilitiesReason",
-        "ResourceTypes",
-        "Version",
-        "Metadata",
-        "DeclaredTransforms"
-    ]]) + "}",
+    TEMPLATE: '{"TemplateBody":TemplateBody,"StagesAvailable":StagesAvailable}',
+    TEMPLATE_SUMMARY: '{"Parameters":Parameters,"Description":Description,"Capabilities":Capabilities,'
+                      '"CapabilitiesReason":CapabilitiesReason,"ResourceTypes":ResourceTypes,"Version":Version,'
+                      '"Metadata":Metadata,"DeclaredTransforms":DeclaredTransforms}',
 }
 
 RESOURCE_NAMES = [
@@ -58,6 +47,7 @@ RESOURCE_NAMES = [
     STACK_RESOURCE,
     STACK_RESOURCES,
     STACKS,
+    STACK_LIST,
     CHANGE_SETS_SUMMARY,
     RESOURCES_SUMMARY,
     STACKS_SUMMARY,
@@ -70,6 +60,11 @@ RESOURCES_WITH_TAGS = [
     STACKS
 ]
 
+# resources retrieved with list_ calls that do not have the _summary postfix
+SUMMARY_RESOURCES = frozenset([CHANGE_SETS_SUMMARY, RESOURCES_SUMMARY, STACKS_SUMMARY])
+# resources retrieved with get_ calls
+GET_RESOURCES = frozenset([STACK_POLICY, TEMPLATE, TEMPLATE_SUMMARY])
+
 
 class CloudformationService(AwsService):
     """
@@ -95,6 +90,15 @@ class CloudformationService(AwsService):
                             custom_result_paths=CUSTOM_RESULT_PATHS,
                             service_retry_strategy=service_retry_strategy)
 
+    @staticmethod
+    def preferred_listing_resource():
+        """
+        Returns the resource to use for listing stacks when only their names, ids and status are needed. These are listed with
+        ListStacks, which returns smaller results than DescribeStacks called without a stack name
+        :return: Name of the resource for listing stacks
+        """
+        return STACK_LIST
+
     def describe_resources_function_name(self, resource_name):
         """
         Returns the name of the boto client method call to retrieve the specified resource.
@@ -103,10 +107,10 @@ class CloudformationService(AwsService):
         """
         s = AwsService.describe_resources_function_name(self, resource_name=resource_name)
 
-        if resource_name in [CHANGE_SETS_SUMMARY, RESOURCES_SUMMARY, STACKS_SUMMARY]:
+        if resource_name in SUMMARY_RESOURCES:
             s = s.replace("describe_", "list_")[0:-len("_Summary")]
 
-        elif resource_name in [STACK_POLICY, TEMPLATE, TEMPLATE_SUMMARY]:
+        elif resource_name in GET_RESOURCES:
             s = s.replace("describe_", "get_")
 
         elif resource_name == STACK_LIST:
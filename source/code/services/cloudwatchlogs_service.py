@@ -10,6 +10,8 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
+from functools import lru_cache
+
 from services.aws_service import AwsService
 
 DESTINATIONS = "Destinations"
@@ -37,6 +39,21 @@ RESOURCE_NAMES = [
     LOG_EVENTS
 ]
 
+# results for this service start with lowercase
+CUSTOM_RESULT_PATHS = {r: r[0].lower() + r[1:] for r in RESOURCE_NAMES}
+CUSTOM_RESULT_PATHS[LOG_EVENTS] = "events"
+
+
+@lru_cache(maxsize=None)
+def _tuple_name(name):
+    return name[0].upper() + name[1:]
+
+
+@lru_cache(maxsize=None)
+def _parameter_name(name):
+    # for this service arguments start with lowercase
+    return name[0].lower() + name[1:]
+
 
 class CloudwatchlogsService(AwsService):
     def __init__(self, role_arn=None, session=None, tags_as_dict=True, as_named_tuple=False, service_retry_strategy=None):
@@ -49,9 +66,6 @@ class CloudwatchlogsService(AwsService):
         :param service_retry_strategy: service retry strategy for making boto api calls
         """
 
-        custom_resource_paths = {r: r[0].lower() + r[1:] for r in RESOURCE_NAMES}
-        custom_resource_paths[LOG_EVENTS] = "events"
-
         AwsService.__init__(self,
                             service_name='logs',
                             resource_names=RESOURCE_NAMES,
@@ -59,7 +73,7 @@ class CloudwatchlogsService(AwsService):
                             session=session,
                             tags_as_dict=tags_as_dict,
                             as_named_tuple=as_named_tuple,
-                            custom_result_paths=custom_resource_paths,
+                            custom_result_paths=CUSTOM_RESULT_PATHS,
                             mapped_parameters=MAPPED_PARAMETERS,
                             next_token_argument=NEXT_TOKEN_ARGUMENT,
                             next_token_result=NEXT_TOKEN_RESULT,
@@ -71,7 +85,7 @@ class CloudwatchlogsService(AwsService):
         :param name:
         :return:
         """
-        return name[0].upper() + name[1:]
+        return _tuple_name(name)
 
     def describe_resources_function_name(self, resource_name):
         """
@@ -93,9 +107,7 @@ class CloudwatchlogsService(AwsService):
         :param args: parameters to be mapped
         :return: mapped parameters
         """
-        if len(args) == 0:
+        if not args:
             return args
         temp = AwsService._map_describe_function_parameters(self, resources, args)
-        # for this service arguments start with lowercase
-        translated = {b[0].lower() + b[1:]: temp[b] for b in temp}
-        return translated
+        return {_parameter_name(name): value for name, value in temp.items()}
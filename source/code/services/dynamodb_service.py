@@ -10,7 +10,6 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
-import boto_retry
 from services.aws_service import AwsService
 
 TABLES = "Tables"
@@ -39,6 +38,9 @@ RESOURCES_WITH_TAGS = [
     TABLE
 ]
 
+# resources retrieved with list_ calls
+LIST_RESOURCES = frozenset([TAGS_OF_RESOURCE, TABLES, BACKUPS])
+
 NEXT_TOKEN_ARGUMENT = "ExclusiveStartTableName"
 NEXT_TOKEN_RESULT = "LastEvaluatedTableName"
 
@@ -46,6 +48,12 @@ MAPPED_PARAMETERS = {
     "MaxResults": "Limit"
 }
 
+TABLE_ARN_PREFIX = "arn:aws:dynamodb:{}:{}:table/"
+
+# maximum number of tables in a page for which the tags are listed per table, for pages with more tables the tags are
+# retrieved using the resource groups tagging api
+LIST_TAGS_MAX_TABLES = 10
+
 
 class DynamodbService(AwsService):
     def __init__(self, role_arn=None, session=None, tags_as_dict=True, as_named_tuple=False, service_retry_strategy=None):
@@ -69,6 +77,9 @@ class DynamodbService(AwsService):
                             next_token_result=NEXT_TOKEN_RESULT,
                             service_retry_strategy=service_retry_strategy)
 
+        # arn prefixes for tables by region
+        self._table_arn_prefixes = {}
+
     @staticmethod
     def is_regional():
         return True
@@ -81,7 +92,11 @@ class DynamodbService(AwsService):
         """
         s = AwsService.describe_resources_function_name(self, resource_name)
 
-        return s.replace("describe_", "list_") if resource_name in [TAGS_OF_RESOURCE, TABLES, BACKUPS] else s
+        return s.replace("describe_", "list_") if resource_name in LIST_RESOURCES else s
+
+    @staticmethod
+    def use_cached_tags(resource, tags_to_retrieve):
+        return tags_to_retrieve > LIST_TAGS_MAX_TABLES
 
     def _get_tags_for_resource(self, client, resource):
         """
@@ -91,18 +106,21 @@ class DynamodbService(AwsService):
         :return: Tags
         """
 
-        arn = "arn:aws:dynamodb:{}:{}:table/{}".format(client.meta.region_name, self.aws_account,
-                                                       resource["TableName"])
-
-        if self._service_retry_strategy is not None:
-
-            if getattr(self._service_client, "list_tags_of_resource" + boto_retry.DEFAULT_SUFFIX, None) is None:
-                boto_retry.make_method_with_retries(boto_client_or_resource=self._service_client,
-                                                    name="list_tags_of_resource",
-                                                    service_retry_strategy=self._service_retry_strategy)
-            return client.list_tags_of_resource_with_retries(ResourceArn=arn).get("Tags", [])
-
-        return client.list_tags_of_resource(ResourceArn=arn).get("Tags", [])
+        region = client.meta.region_name
+        arn_prefix = self._table_arn_prefixes.get(region)
+        if arn_prefix is None:
+            arn_prefix = TABLE_ARN_PREFIX.format(region, self.aws_account)
+            self._table_arn_prefixes[region] = arn_prefix
+        arn = arn_prefix + resource["TableName"]
+
+        # tags for all tables in the response are retrieved with a single paginated tagging api call
+        if self._use_cached_tags:
+            tags = self.cached_tags_for_resource(arn, resource_name="table", region=region)
+            if tags is not None:
+                return tags
+
+        list_tags = self._client_method_with_retries(client, "list_tags_of_resource")
+        return list_tags(ResourceArn=arn).get("Tags", [])
 
     def _get_tag_resource(self):
         """
@@ -11,8 +11,10 @@
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
 import os
+import threading
+from functools import lru_cache
 
-import boto3
+from botocore.loaders import create_loader
 
 from boto_retry import get_client_with_retries
 from services.aws_service import AwsService
@@ -109,7 +111,7 @@ CUSTOM_RESULT_PATHS = custom_result_paths = {
         "BlockDeviceMappings",
         "Description",
         "DisableApiTermination",
-        "EbsOptimized"
+        "EbsOptimized",
         "EnaSupport",
         "Groups",
         "InstanceId",
@@ -147,7 +149,7 @@ CUSTOM_RESULT_PATHS = custom_result_paths = {
     SPOT_FLEET_INSTANCES: "ActiveInstances",
     FLEET_REQUEST_HISTORY: "{" + ",".join(['"{}":{}'.format(i, i) for i in [
         "HistoryRecords",
-        "LastEvaluatedTime"
+        "LastEvaluatedTime",
         "SpotFleetRequestId",
         "StartTime"
     ]]) + "}",
@@ -223,7 +225,6 @@ RESOURCE_NAMES = [
     SPOT_FLEET_REQUESTS,
     SPOT_INSTANCE_REQUESTS,
     SPOT_PRICE_HISTORY,
-    SECURITY_GROUPS,
     SUBNETS,
     TAGS,
     VOLUME_ATTRIBUTE,
@@ -262,7 +263,46 @@ RESOURCES_WITH_TAGS = [
     VPN_GATEWAYS
 ]
 
+# number of resources to retrieve per call
+PAGE_SIZES = {
+    INSTANCES: 1000,
+    SNAPSHOTS: 1000,
+    VOLUMES: 500
+}
+
+# minimum number of resources to request per call, the describe calls reject a lower page size
+MIN_PAGE_SIZES = {
+    INSTANCES: 5,
+    SNAPSHOTS: 5,
+    VOLUMES: 5
+}
+
+# parameters that select resources by id, these can not be combined with a page size
+ID_PARAMETERS = {
+    INSTANCES: "InstanceIds",
+    SNAPSHOTS: "SnapshotIds",
+    VOLUMES: "VolumeIds"
+}
+
+# resources returned as attributes with their values wrapped in a "Value" attribute
+ATTRIBUTE_RESOURCES = frozenset([
+    INSTANCE_ATTRIBUTE,
+    IMAGE_ATTRIBUTE,
+    INTERFACE_ATTRIBUTE,
+    SNAPSHOT_ATTRIBUTE,
+    FLEET_REQUEST_HISTORY,
+    VOLUME_ATTRIBUTE,
+    VPC_ATTRIBUTE
+])
+
 _valid_instance_types = None
+_valid_instance_types_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _instance_types_from_env(ec2_types):
+    # skips empty entries from stray commas, cached so returned as a tuple that callers cannot modify
+    return tuple(e for e in (t.strip() for t in ec2_types.split(",")) if e)
 
 
 class Ec2Service(AwsService):
@@ -286,21 +326,26 @@ class Ec2Service(AwsService):
                             as_named_tuple=as_named_tuple,
                             tags_as_dict=tags_as_dict,
                             custom_result_paths=CUSTOM_RESULT_PATHS,
+                            page_sizes=PAGE_SIZES,
+                            min_page_sizes=MIN_PAGE_SIZES,
                             service_retry_strategy=service_retry_strategy)
 
+    def _page_size_argument_name(self, resources, args):
+        """
+        Returns the name of the page size parameter, None if the resources are selected by their ids
+        :param resources: Name of the resource type
+        :param args: Parameters passed to the describe call
+        :return: Name of the page size parameter
+        """
+        if args.get(ID_PARAMETERS.get(resources)):
+            return None
+        return AwsService._page_size_argument_name(self, resources, args)
+
     def _transform_returned_resource(self, client, resource, use_cached_tags=False):
 
-        if self._resource_name in [INSTANCE_ATTRIBUTE,
-                                   IMAGE_ATTRIBUTE,
-                                   INTERFACE_ATTRIBUTE,
-                                   SNAPSHOT_ATTRIBUTE,
-                                   FLEET_REQUEST_HISTORY,
-                                   VOLUME_ATTRIBUTE,
-                                   VPC_ATTRIBUTE]:
-            temp = {r: resource[r] for r in resource if resource[r] is not None}
-            for r in temp:
-                if isinstance(temp[r], dict) and "Value" in temp[r]:
-                    temp[r] = temp[r]["Value"]
+        if self._resource_name in ATTRIBUTE_RESOURCES:
+            temp = {r: v["Value"] if type(v) is dict and "Value" in v else v
+                    for r, v in resource.items() if v is not None}
         else:
             temp = resource
 
@@ -321,35 +366,43 @@ class Ec2Service(AwsService):
         # first check if the environment variable is set
         ec2_types = os.getenv(ENV_EC2_VALID_INSTANCE_TYPES, "").strip()
         if ec2_types != "":
-            return [e.strip() for e in ec2_types.split(",")]
+            return list(_instance_types_from_env(ec2_types))
 
         # if the types are not in the environment variable fetch the types from the pricing service api
         global _valid_instance_types
-        if _valid_instance_types is None:
-            _valid_instance_types = []
-            # noinspection PyPep8
-            try:
-                pricing = get_client_with_retries("pricing", ["get_attribute_values"], region="us-east-1")
-
-                args = {
-                    "ServiceCode": "AmazonEC2",
-                    "AttributeName": "instanceType",
-                    "_expected_boto3_exceptions_": ["AccessDeniedException"]
-                }
-                while True:
-                    sc = pricing.get_attribute_values_with_retries(**args)
-                    for a in sc.get("AttributeValues"):
-                        if len(a["Value"].split(".")) > 1:
-                            _valid_instance_types.append(a["Value"])
-                    if "NextToken" in sc:
-                        args["NextToken"] = sc["NextToken"]
-                    else:
-                        break
-            except Exception as ex:
-                ec2 = boto3.Session().client("ec2")
-                # noinspection PyProtectedMember
-                _valid_instance_types = ec2._service_model._service_description["shapes"]["InstanceType"]["enum"]
-                version = ec2._service_model.api_version
-                if logger is not None:
-                    logger.warning(WARN_NO_PRICING_API_ACCESS, ex, version)
+        if _valid_instance_types is not None:
+            return _valid_instance_types
+
+        with _valid_instance_types_lock:
+            if _valid_instance_types is None:
+                instance_types = []
+                # noinspection PyPep8
+                try:
+                    pricing = get_client_with_retries("pricing", ["get_attribute_values"], region="us-east-1")
+
+                    args = {
+                        "ServiceCode": "AmazonEC2",
+                        "AttributeName": "instanceType",
+                        "_expected_boto3_exceptions_": ["AccessDeniedException"]
+                    }
+                    append = instance_types.append
+                    while True:
+                        sc = pricing.get_attribute_values_with_retries(**args)
+                        for a in sc.get("AttributeValues", ()):
+                            value = a["Value"]
+                            if "." in value:
+                                append(value)
+                        if "NextToken" in sc:
+                            args["NextToken"] = sc["NextToken"]
+                        else:
+                            break
+                except Exception as ex:
+                    # read the types from the ec2 service model of the installed botocore, no client is needed for that
+                    ec2_model = create_loader().load_service_model("ec2", "service-2")
+                    instance_types = list(ec2_model["shapes"]["InstanceType"]["enum"])
+                    version = ec2_model["metadata"]["apiVersion"]
+                    if logger is not None:
+                        logger.warning(WARN_NO_PRICING_API_ACCESS, ex, version)
+                # only published when complete, so other threads never see a partial list
+                _valid_instance_types = instance_types
         return _valid_instance_types
@@ -10,6 +10,8 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
+from functools import lru_cache
+
 from services.aws_service import AwsService
 
 
@@ -58,6 +60,22 @@ NEXT_TOKEN_RESULT = "nextToken"
 
 MAPPED_PARAMETERS = {}
 
+# resources retrieved with list_ calls
+LIST_RESOURCES = frozenset([
+    CLUSTERS_ARNS,
+    CONTAINER_INSTANCES_ARNS,
+    SERVICES_ARNS,
+    TASK_DEFINITION_FAMILIES,
+    TASK_DEFINITIONS_ARNS,
+    TASK_ARNS
+])
+
+
+@lru_cache(maxsize=None)
+def _parameter_name(name):
+    # for this service arguments start with lowercase
+    return name[:1].lower() + name[1:]
+
 
 class EcsService(AwsService):
     def __init__(self, role_arn=None, session=None, tags_as_dict=True, as_named_tuple=False, service_retry_strategy=None):
@@ -88,21 +106,14 @@ class EcsService(AwsService):
         :return: Name of the boto3 client function to retrieve the specified resource type
         """
         s = AwsService.describe_resources_function_name(self, resource_name)
-        if resource_name in [CLUSTERS_ARNS,
-                             CONTAINER_INSTANCES_ARNS,
-                             SERVICES_ARNS,
-                             TASK_DEFINITION_FAMILIES,
-                             TASK_DEFINITIONS_ARNS,
-                             TASK_ARNS]:
+        if resource_name in LIST_RESOURCES:
             return s.replace("describe_", "list_")
         return s
 
     def _map_describe_function_parameters(self, resources, args):
-        if len(args) == 0:
+        if not args:
             return args
         temp = AwsService._map_describe_function_parameters(self, resources, args)
-        # for this service arguments start with lowercase
-        translated = {b[0].lower() + b[1:]: temp[b] for b in temp}
-        return translated
+        return {_parameter_name(name): value for name, value in temp.items()}
 
 
@@ -10,7 +10,6 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
-import boto_retry
 from services.aws_service import AwsService
 
 ALLOWED_NODE_TYPE_MODIFICATIONS = "AllowedNodeTypeModifications"
@@ -64,6 +63,13 @@ RESOURCES_WITH_TAGS = [
 
 ARN = "arn:aws:elasticache:{}:{}:{}:{}"
 
+# resources retrieved with list_ calls
+LIST_RESOURCES = frozenset([ALLOWED_NODE_TYPE_MODIFICATIONS, TAGS_FOR_RESOURCE])
+
+# maximum number of resources in a page for which the tags are listed per resource, for pages with more resources the tags
+# are retrieved using the resource groups tagging api
+LIST_TAGS_MAX_RESOURCES = 10
+
 
 class ElasticacheService(AwsService):
     def __init__(self, role_arn=None, session=None, tags_as_dict=True, as_named_tuple=False, service_retry_strategy=None):
@@ -97,10 +103,14 @@ class ElasticacheService(AwsService):
         """
         s = AwsService.describe_resources_function_name(self, resource_name=resource_name)
 
-        if resource_name in [ALLOWED_NODE_TYPE_MODIFICATIONS, TAGS_FOR_RESOURCE]:
+        if resource_name in LIST_RESOURCES:
             s = s.replace("describe_", "list_")
         return s
 
+    @staticmethod
+    def use_cached_tags(resource, tags_to_retrieve):
+        return tags_to_retrieve > LIST_TAGS_MAX_RESOURCES
+
     def _get_tags_for_resource(self, client, resource):
         """
         Returns the tags for specific resources that require additional boto calls to retrieve their tags.
@@ -109,30 +119,32 @@ class ElasticacheService(AwsService):
         :param resource: The resource for which to retrieve the tags
         :return: Tags
         """
-        if self._resource_name not in RESOURCES_WITH_TAGS:
-            raise ValueError("Resource type {] does not support tags".format(self._resource_name))
+        resource_name = self._resource_name
+        if resource_name not in self._resources_with_tags:
+            raise ValueError("Resource type {} does not support tags".format(resource_name))
 
-        if self._resource_name == CACHE_CLUSTERS:
-            if resource["CacheClusterStatus"] not in ["available"]:
+        if resource_name == CACHE_CLUSTERS:
+            if resource["CacheClusterStatus"] != "available":
                 return []
             arn_name = resource["CacheClusterId"]
             arn_resource = "cluster"
         else:
-            if resource["SnapshotStatus"] in ["creating"]:
+            if resource["SnapshotStatus"] == "creating":
                 return []
             arn_name = resource["SnapshotName"]
             arn_resource = "snapshot"
 
-        arn = ARN.format(client.meta.region_name, self.aws_account, arn_resource, arn_name)
+        region = client.meta.region_name
+        arn = ARN.format(region, self.aws_account, arn_resource, arn_name)
 
-        if self._service_retry_strategy is not None:
-            if getattr(self._service_client, "list_tags_for_resource" + boto_retry.DEFAULT_SUFFIX, None) is None:
-                boto_retry.make_method_with_retries(boto_client_or_resource=self._service_client,
-                                                    name="list_tags_for_resource",
-                                                    service_retry_strategy=self._service_retry_strategy)
-            return client.list_tags_for_resource_with_retries(ResourceName=arn).get("TagList", [])
+        # tags for all resources in the response are retrieved with a single paginated tagging api call
+        if self._use_cached_tags:
+            tags = self.cached_tags_for_resource(arn, resource_name=arn_resource, region=region)
+            if tags is not None:
+                return tags
 
-        return client.list_tags_for_resource(ResourceName=arn).get("TagList", [])
+        list_tags = self._client_method_with_retries(client, "list_tags_for_resource")
+        return list_tags(ResourceName=arn).get("TagList", [])
 
     def _get_tag_resource(self):
         """
@@ -10,7 +10,6 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
-import boto_retry
 from services.aws_service import AwsService
 
 LOAD_BALANCERS = "LoadBalancers"
@@ -51,6 +50,9 @@ RESOURCES_WITH_TAGS = [
     LOAD_BALANCERS
 ]
 
+# maximum number of load balancers in a single describe_tags call
+DESCRIBE_TAGS_MAX_NAMES = 20
+
 
 class ElbService(AwsService):
     def __init__(self, role_arn=None, session=None, tags_as_dict=True, as_named_tuple=False, service_retry_strategy=None):
@@ -76,6 +78,26 @@ class ElbService(AwsService):
                             next_token_result=NEXT_TOKEN_RESULT,
                             service_retry_strategy=service_retry_strategy)
 
+        # tags by load balancer name for the resources of the current page
+        self._prefetched_tags = {}
+
+    def _prefetch_tags_for_resources(self, client, resources):
+        """
+        Retrieves the tags for the load balancers of a page in calls for up to DESCRIBE_TAGS_MAX_NAMES load balancers
+        :param client: Client that can be used to make the boto call to retrieve the tags
+        :param resources: The resources of the page
+        """
+        self._prefetched_tags = {}
+        if self._resource_name not in self._resources_with_tags:
+            return
+
+        names = [r["LoadBalancerName"] for r in resources if r.get("Tags") is None]
+        describe_tags = self._client_method_with_retries(client, "describe_tags")
+        for i in range(0, len(names), DESCRIBE_TAGS_MAX_NAMES):
+            resp = describe_tags(LoadBalancerNames=names[i:i + DESCRIBE_TAGS_MAX_NAMES])
+            for tag_description in resp.get("TagDescriptions", []):
+                self._prefetched_tags[tag_description["LoadBalancerName"]] = self._tags_from_list(tag_description.get("Tags", []))
+
     def _get_tags_for_resource(self, client, resource):
         """
         Returns the tags for specific resources that require additional boto calls to retrieve their tags.
@@ -84,21 +106,18 @@ class ElbService(AwsService):
         :param resource: The resource for which to retrieve the tags
         :return: Tags
         """
-        if self._resource_name not in RESOURCES_WITH_TAGS:
-            raise ValueError("Resource type {] does not support tags".format(self._resource_name))
+        if self._resource_name not in self._resources_with_tags:
+            raise ValueError("Resource type {} does not support tags".format(self._resource_name))
 
-        if self._service_retry_strategy is not None:
-            if getattr(self._service_client, "list_tags_for_resource" + boto_retry.DEFAULT_SUFFIX, None) is None:
-                boto_retry.make_method_with_retries(boto_client_or_resource=self._service_client,
-                                                    name="describe_tags",
-                                                    service_retry_strategy=self._service_retry_strategy)
-            tag_list = client.describe_tags_with_retries(LoadBalancerNames=[resource["LoadBalancerName"]]).get("TagDescriptions")
+        tags = self._prefetched_tags.get(resource["LoadBalancerName"])
+        if tags is not None:
+            return tags
 
-        else:
-            tag_list = client.describe_tags(LoadBalancerNames=[resource["LoadBalancerName"]]).get("TagDescriptions")
+        describe_tags = self._client_method_with_retries(client, "describe_tags")
+        tag_list = describe_tags(LoadBalancerNames=[resource["LoadBalancerName"]]).get("TagDescriptions")
 
         if len(tag_list) > 0:
-            return [{"Key": t["Key"], "Value": t["Value"]} for t in tag_list[0].get("Tags", [])]
+            return self._tags_from_list(tag_list[0].get("Tags", []))
         else:
             return {}
 
@@ -92,6 +92,15 @@ MAPPED_PARAMETERS = {
     "MaxResults": "MaxItems"
 }
 
+# number of resources to retrieve per call, the service default is 100
+PAGE_SIZES = {
+    GROUPS: 1000,
+    INSTANCE_PROFILES: 1000,
+    POLICIES: 1000,
+    ROLES: 1000,
+    USERS: 1000
+}
+
 
 class IamService(AwsService):
     def __init__(self, role_arn=None, session=None, tags_as_dict=True, as_named_tuple=False, service_retry_strategy=None):
@@ -113,6 +122,7 @@ class IamService(AwsService):
                             mapped_parameters=MAPPED_PARAMETERS,
                             next_token_argument=NEXT_TOKEN_ARGUMENT,
                             next_token_result=NEXT_TOKEN_RESULT,
+                            page_sizes=PAGE_SIZES,
                             service_retry_strategy=service_retry_strategy)
 
     @staticmethod
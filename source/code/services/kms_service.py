@@ -52,6 +52,8 @@ RESOURCES_WITH_TAGS = [
     KEY
 ]
 
+GET_RESOURCES = frozenset([KEY_POLICY, KEY_ROTATION_STATUS, PARAMETERS_FOR_INPUT])
+
 NEXT_TOKEN_ARGUMENT = "Marker"
 NEXT_TOKEN_RESULT = "NextMarker"
 
@@ -59,6 +61,12 @@ MAPPED_PARAMETERS = {
     "MaxResults": "Limit"
 }
 
+# maximum number of resources to retrieve per call, the service defaults are 50 for grants and 100 for keys
+PAGE_SIZES = {
+    GRANTS: 100,
+    KEYS: 1000
+}
+
 
 class KmsService(AwsService):
     def __init__(self, role_arn=None, session=None, tags_as_dict=True, as_named_tuple=False, service_retry_strategy=None):
@@ -82,6 +90,7 @@ class KmsService(AwsService):
                             mapped_parameters=MAPPED_PARAMETERS,
                             next_token_argument=NEXT_TOKEN_ARGUMENT,
                             next_token_result=NEXT_TOKEN_RESULT,
+                            page_sizes=PAGE_SIZES,
                             service_retry_strategy=service_retry_strategy)
 
     def describe_resources_function_name(self, resource_name):
@@ -91,9 +100,9 @@ class KmsService(AwsService):
         :return: Name of the boto3 client function to retrieve the specified resource type
         """
         s = AwsService.describe_resources_function_name(self, resource_name)
-        if resource_name in [KEY]:
+        if resource_name == KEY:
             return s
-        if resource_name in [KEY_POLICY, KEY_ROTATION_STATUS, PARAMETERS_FOR_INPUT, KEY]:
+        if resource_name in GET_RESOURCES:
             return s.replace("describe_", "get_")
         return s.replace("describe_", "list_")
 
@@ -104,8 +113,18 @@ class KmsService(AwsService):
         :param resource: The resource for which to retrieve the tags
         :return: Tags
         """
-        tags = self.describe(RESOURCE_TAGS, region=client.meta.region_name, tags_as_dict=False, KeyId=resource["KeyId"])
-        return [{"Key": t["TagKey"], "Value": t["TagValue"]} for t in tags]
+        # not using describe for the ResourceTags resource, as that would reset the state of the running describe call
+        list_resource_tags = self._client_method_with_retries(client, "list_resource_tags")
+        args = {"KeyId": resource["KeyId"]}
+        tags = []
+        while True:
+            resp = list_resource_tags(**args)
+            tags += resp.get("Tags", [])
+            if not resp.get("Truncated", False):
+                break
+            args[NEXT_TOKEN_ARGUMENT] = resp[NEXT_TOKEN_RESULT]
+
+        return self._tags_from_list(tags, key="TagKey", value="TagValue")
 
     def _get_tag_resource(self):
         """
@@ -10,6 +10,8 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
+from concurrent.futures import ThreadPoolExecutor
+
 from services.aws_service import AwsService
 
 ACCOUNT_SETTINGS = "AccountSettings"
@@ -46,6 +48,12 @@ RESOURCE_NAMES = [
     VERSIONS_BY_FUNCTION
 ]
 
+GET_RESOURCES = frozenset([FUNCTION, ALIAS, EVENT_SOURCE_MAPPING, FUNCTION_CONFIGURATION, POLICY])
+
+# number of threads used to retrieve the tags for the functions of a page, for pages with more functions
+# the tags are retrieved using the resource groups tagging api
+LIST_TAGS_WORKERS = 10
+
 NEXT_TOKEN_ARGUMENT = "Marker"
 NEXT_TOKEN_RESULT = "NextMarker"
 
@@ -76,6 +84,9 @@ class LambdaService(AwsService):
                             next_token_result=NEXT_TOKEN_RESULT,
                             service_retry_strategy=service_retry_strategy)
 
+        # tags by function arn for the resources of the current page
+        self._prefetched_tags = {}
+
     def describe_resources_function_name(self, resource_name):
         """
         Returns the name of the boto client method call to retrieve the specified resource.
@@ -83,10 +94,40 @@ class LambdaService(AwsService):
         :return: Name of the boto3 client function to retrieve the specified resource type
         """
         s = AwsService.describe_resources_function_name(self, resource_name)
-        if resource_name in [FUNCTION, ALIAS, EVENT_SOURCE_MAPPING, FUNCTION_CONFIGURATION, POLICY]:
+        if resource_name in GET_RESOURCES:
             return s.replace("describe_", "get_")
         return s.replace("describe_", "list_")
 
+    @staticmethod
+    def use_cached_tags(resource, tags_to_retrieve):
+        return resource == FUNCTIONS and tags_to_retrieve > LIST_TAGS_WORKERS
+
+    def _prefetch_tags_for_resources(self, client, resources):
+        """
+        Retrieves the tags for the functions of a page in parallel calls, using up to LIST_TAGS_WORKERS threads
+        :param client: Client that can be used to make the boto call to retrieve the tags
+        :param resources: The resources of the page
+        """
+        self._prefetched_tags = {}
+        if self._resource_name != FUNCTIONS:
+            return
+
+        arns = [r["FunctionArn"] for r in resources if r.get("Tags") is None]
+        if len(arns) < 2:
+            return
+
+        # loads the tags using the tagging api, if the role is not allowed to use it the tags are listed per function
+        if self._use_cached_tags and self.cached_tags_for_resource(arns[0], "function", client.meta.region_name) is not None:
+            return
+
+        list_tags = self._client_method_with_retries(client, "list_tags")
+
+        def get_tags(arn):
+            return arn, list_tags(Resource=arn).get("Tags", {})
+
+        with ThreadPoolExecutor(max_workers=min(len(arns), LIST_TAGS_WORKERS)) as executor:
+            self._prefetched_tags = dict(executor.map(get_tags, arns))
+
     def _get_tags_for_resource(self, client, resource):
         """
         Returns the tags for specific resources that require additional boto calls to retrieve their tags. Most likely this
@@ -97,8 +138,16 @@ class LambdaService(AwsService):
         if self._resource_name == FUNCTION:
             tags = resource.get("Tags", {})
         else:
-            tags = client.list_tags(Resource=resource["FunctionArn"]).get("Tags")
-        return [{"Key": t, "Value": tags[t]} for t in tags]
+            tags = self._prefetched_tags.get(resource["FunctionArn"])
+            if tags is None and self._use_cached_tags:
+                # tags for all functions in the region are retrieved with a single paginated tagging api call
+                cached_tags = self.cached_tags_for_resource(resource["FunctionArn"], "function", client.meta.region_name)
+                if cached_tags is not None:
+                    return cached_tags
+            if tags is None:
+                list_tags = self._client_method_with_retries(client, "list_tags")
+                tags = list_tags(Resource=resource["FunctionArn"]).get("Tags", {})
+        return self._tags_from_list([{"Key": t, "Value": tags[t]} for t in tags])
 
     def _get_tag_resource(self):
         """
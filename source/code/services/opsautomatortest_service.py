@@ -10,16 +10,54 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
 #  and limitations under the License.                                                                                # 
 ######################################################################################################################
-import datetime
 import json
 import random
+import re
 import time
-from datetime import datetime
 
 import actions.ops_automator_test_action
 import services
 from scheduling.setbuilder import SetBuilder
-from services.aws_service import AwsService
+from services.aws_service import AwsService, available_regions
+
+# resource numbers specified as a single range of numbers, e.g. 1-100
+_RANGE_SPEC = re.compile(r"^(\d+)-(\d+)$")
+
+
+def _range_from_spec(spec, max_value):
+    """
+    Returns the resource numbers for a specification that is a single range of numbers
+    :param spec: Specification of the resource numbers
+    :param max_value: Highest resource number that can be used
+    :return: Range with the resource numbers, None if the specification is not a single valid range
+    """
+    m = _RANGE_SPEC.match(spec)
+    if m is not None:
+        first, last = int(m.group(1)), int(m.group(2))
+        if first <= last <= max_value:
+            return range(first, last + 1)
+    return None
+
+
+def _tags_from_str(tag_str):
+    """
+    Parses tags specified as a comma separated list of key=value pairs, parts without a "=" belong to the value of the last key
+    :param tag_str: String with the tags
+    :return: Dictionary with the tags
+    """
+    # parts of the value for each key
+    values = None
+
+    tags = {}
+    for t in tag_str.split(","):
+        t = t.strip()
+        if "=" in t:
+            t = t.partition("=")
+            values = [t[2].strip()]
+            tags[t[0].strip()] = values
+        elif values is not None:
+            values.append(t)
+    return {key: ",".join(values) for key, values in tags.items()}
 
 
 # Test service used for generating test resources used by the Ops Automator test action
@@ -46,6 +84,7 @@ class OpsautomatortestService(AwsService):
         self._test_data = None
         self._region = None
         self._tags = None
+        self._resource_numbers = None
 
     @property
     def _number_of_resources(self):
@@ -54,6 +93,10 @@ class OpsautomatortestService(AwsService):
             assert (spec is not None)
             # dict as json, key is region, value is spec for region
             if isinstance(spec, str):
+                # a single range does not need to be expanded into a set by the SetBuilder
+                numbers = _range_from_spec(spec, actions.ops_automator_test_action.TEST_MAX_RESOURCES)
+                if numbers is not None:
+                    return numbers
                 # noinspection PyBroadException,PyPep8
                 try:
                     spec = json.loads(spec)
@@ -63,7 +106,7 @@ class OpsautomatortestService(AwsService):
 
             # number of resources
             if isinstance(spec, int):
-                return set([i + 1 for i in range(0, spec)])
+                return range(1, spec + 1)
 
             elif isinstance(spec, dict):
                 # native dict, key is region, value is spec for region
@@ -73,7 +116,11 @@ class OpsautomatortestService(AwsService):
                     return get_number_of_resources(spec["*"])
             return set()
 
-        return get_number_of_resources(self._args.get(actions.ops_automator_test_action.PARAM_TEST_RESOURCES, 0))
+        if self._resource_numbers is None:
+            numbers = get_number_of_resources(self._args.get(actions.ops_automator_test_action.PARAM_TEST_RESOURCES, 0))
+            # ranges are already sorted
+            self._resource_numbers = numbers if isinstance(numbers, range) else sorted(numbers)
+        return self._resource_numbers
 
     @property
     def region(self):
@@ -82,22 +129,8 @@ class OpsautomatortestService(AwsService):
     @property
     def tags(self):
         if self._tags is None:
-            lastkey = None
-
-            tags = {}
             tag_str = self._args.get(actions.ops_automator_test_action.PARAM_TEST_SELECT_TAGS, "")
-
-            if isinstance(tag_str, str):
-                for t in tag_str.split(","):
-                    t = t.strip()
-                    if "=" in t:
-                        t = t.partition("=")
-                        key = t[0].strip()
-                        tags[key] = t[2].strip()
-                        lastkey = key
-                    elif lastkey is not None:
-                        tags[lastkey] = ",".join([tags[lastkey], t])
-            self._tags = tags
+            self._tags = _tags_from_str(tag_str) if isinstance(tag_str, str) else {}
 
         return self._tags
 
@@ -109,23 +142,15 @@ class OpsautomatortestService(AwsService):
         """
         This method is to retrieve test resources, method parameters are only used signature compatibility
         :param as_tuple: Set to true to return results as immutable named dictionaries instead of dictionaries
-        :return: Test resource
+        :return: Generator for test resources
         """
 
-        def create_resource(r):
-            return {
-                actions.ops_automator_test_action.TEST_RESOURCE_ID: OpsautomatortestService.resource_id(r),
-                "AwsAccount": self.aws_account,
-                "Region": kwargs["region"] if "region" in kwargs else self.region,
-                "Service": self.service_name,
-                "ResourceTypeName": actions.ops_automator_test_action.TEST_RESOURCE_NAMES[0],
-                "Tags": self.tags
-            }
-
-        start = datetime.now()
+        start = time.monotonic()
 
         self._args = kwargs
-        result = [create_resource(i) for i in sorted(self._number_of_resources)]
+        # tags and resource numbers are parsed from the arguments of this call
+        self._tags = None
+        self._resource_numbers = None
 
         if self._args.get(actions.ops_automator_test_action.PARAM_TEST_SELECT_FAILING, False) in ["True", True]:
             raise Exception("Selection of resources fails")
@@ -133,21 +158,38 @@ class OpsautomatortestService(AwsService):
         select_time = int(self._args.get(actions.ops_automator_test_action.PARAM_TEST_SELECT_DURATION, 0))
 
         if select_time != 0:
-            variance = float(self._args.get(actions.ops_automator_test_action.PARAM_TEST_SELECT_DURATION_VARIANCE, 0))
+            try:
+                variance = float(self._args.get(actions.ops_automator_test_action.PARAM_TEST_SELECT_DURATION_VARIANCE, 0))
+            except ValueError:
+                # malformed variance, use the duration without variance
+                variance = 0
             if variance != 0:
-                select_time += (random.uniform(variance * -1, variance) * select_time)
-            time_spend = (datetime.now() - start).total_seconds()
+                select_time *= 1 + random.uniform(-variance, variance)
+            time_spend = time.monotonic() - start
             if time_spend < select_time:
                 time.sleep(select_time - time_spend)
 
-        return result
+        # attributes that are the same for all test resources
+        annotation = {
+            "AwsAccount": self.aws_account,
+            "Region": self.region,
+            "Service": self.service_name,
+            "ResourceTypeName": actions.ops_automator_test_action.TEST_RESOURCE_NAMES[0],
+            "Tags": self.tags
+        }
+
+        resource_id_attribute = actions.ops_automator_test_action.TEST_RESOURCE_ID
+        for i in self._number_of_resources:
+            resource = {resource_id_attribute: OpsautomatortestService.resource_id(i)}
+            resource.update(annotation)
+            yield resource
 
     def service_regions(self):
         """
         Regions that can be used for this service, return all AWS regions (assuming they all support EC2)
         :return: Service regions
         """
-        return services.get_session().get_available_regions(service_name="ec2")
+        return list(available_regions("ec2"))
 
     def get(self, region=None, as_tuple=None, **kwargs):
         """
@@ -156,5 +198,4 @@ class OpsautomatortestService(AwsService):
         :param as_tuple: Set to true to return results as immutable named dictionaries instead of dictionaries
         :return: Service resource of the specified resource type for the service, None if the resource was not available.
         """
-        return self.describe(
-            region=region, as_tuple=as_tuple, **kwargs)[0]
+        return next(self.describe(region=region, as_tuple=as_tuple, **kwargs), None)
@@ -110,6 +110,9 @@ RESOURCES_WITH_TAGS = {
 NEXT_TOKEN_RESULT = "Marker"
 NEXT_TOKEN_ARGUMENT = NEXT_TOKEN_RESULT
 
+# maximum number of threads used by describe_all
+DESCRIBE_ALL_MAX_WORKERS = 32
+
 for name in RESOURCE_NAMES:
     if name.startswith("Db") and name not in CUSTOM_RESULT_PATHS:
         CUSTOM_RESULT_PATHS[name] = result = "DB" + name[2:]
@@ -137,8 +140,10 @@ class RdsService(AwsService):
                             custom_result_paths=CUSTOM_RESULT_PATHS,
                             service_retry_strategy=service_retry_strategy)
         self._tag_session = None
-        self._tag_rds_client = None
         self._tag_account = None
+        # clients to list the tags of resources shared by other accounts, by account and region, shared with the copies made
+        # by describe_many and only changed while holding the service client lock
+        self._tag_rds_clients = {}
 
     def _extract_resources(self, resp, select):
         # the RDS API returns an ARN in the DBSnapshotIdentifierfield for shared snapshots. This overloaded method will
@@ -188,21 +193,22 @@ class RdsService(AwsService):
         resource_region = resource_arn.split(":")[3]
 
         if resource_owner_account == self.aws_account:
-            # sane account, can use same session as used to retrieve the resource
-            if self._use_cached_tags:
-                self._tag_session = self.session
+            # same account, can use same session and client as used to retrieve the resource
+            tag_session = self.session
 
             # make sure the client has retries
-            if getattr(self._service_client, "list_tags_for_resource" + boto_retry.DEFAULT_SUFFIX, None) is None:
-                boto_retry.make_method_with_retries(boto_client_or_resource=client,
-                                                    name="list_tags_for_resource",
-                                                    service_retry_strategy=self._service_retry_strategy)
-                self._tag_rds_client = client
+            with self._service_client_lock:
+                if getattr(client, "list_tags_for_resource" + boto_retry.DEFAULT_SUFFIX, None) is None:
+                    boto_retry.make_method_with_retries(boto_client_or_resource=client,
+                                                        name="list_tags_for_resource",
+                                                        service_retry_strategy=self._service_retry_strategy)
+            tag_client = client
         else:
             # resource is from other account, get a session to get the tags from that account as these are not
             # visible for shared rds resources
             if self._tag_account != resource_owner_account or self._tag_session is None:
                 self._tag_account = resource_owner_account
+                self._tag_session = None
                 used_tag_role = None
                 if self._tag_roles is not None:
                     # see if there is a role for the owner account
@@ -215,25 +221,53 @@ class RdsService(AwsService):
                         # in other cases it is not possible to retrieve the tags
                         if resource_owner_account != os.getenv(handlers.ENV_OPS_AUTOMATOR_ACCOUNT):
                             return {}
-                self._tag_session = services.get_session(role_arn=used_tag_role)
-
-            if not self._use_cached_tags:
-                self._tag_rds_client = boto_retry.get_client_with_retries("rds", methods=["list_tags_for_resource"],
-                                                                          context=self._context, region=resource_region)
+                self._tag_session = services.get_session(role_arn=used_tag_role, account=resource_owner_account)
+            tag_session = self._tag_session
+            tag_client = None
 
-        if self._use_cached_tags:
-            return self.cached_tags(session=self._tag_session,
+        # once the tags of the resource type are cached for the region and account, these are used for all its resources
+        if self._use_cached_tags or (self._cached_tags is not None and
+                                     self._cached_tags_region == resource_region and
+                                     self._cached_tags_session == tag_session):
+            return self.cached_tags(session=tag_session,
                                     resource_name=RESOURCES_WITH_TAGS[resource["ResourceTypeName"]],
                                     region=resource_region).get(resource_arn, {})
 
+        if tag_client is None:
+            # clients for other accounts are kept by account and region
+            tag_client_key = (resource_owner_account, resource_region)
+            with self._service_client_lock:
+                tag_client = self._tag_rds_clients.get(tag_client_key)
+                if tag_client is None:
+                    tag_client = boto_retry.get_client_with_retries("rds", methods=["list_tags_for_resource"],
+                                                                    context=self._context, region=resource_region,
+                                                                    session=tag_session)
+                    self._tag_rds_clients[tag_client_key] = tag_client
+
         try:
-            resp = self._tag_rds_client.list_tags_for_resource_with_retries(ResourceName=resource_arn)
+            resp = tag_client.list_tags_for_resource_with_retries(ResourceName=resource_arn)
             return resp.get("TagList", [])
         except botocore.exceptions.ClientError as ex:
             if getattr(ex, "response", {}).get("Error", {}).get("Code", "") == "InvalidParameterValue":
                 return []
             raise_exception("Can not list rds tags for resource {}, {}", resource_arn, ex)
 
+    def describe_all(self, resource_names, regions=None, max_workers=DESCRIBE_ALL_MAX_WORKERS, **describe_args):
+        """
+        Retrieves multiple resource types from one or more regions, the resources for every resource type and region are
+        retrieved in a separate thread, see describe_many
+        :param resource_names: Names of the resource types
+        :param regions: Regions from where resources are retrieved, if None then the current region is used
+        :param max_workers: Maximum number of threads
+        :param describe_args: Parameters passed to the describe method for all resource types
+        :return: Tuples of the region, the name of the resource type and a list of its resources, in the order of the regions
+        and resource types
+        """
+        requests = [(resource_name, {"region": region}) for region in (regions or [None]) for resource_name in resource_names]
+        results = self.describe_many(requests, max_workers=min(max_workers, len(requests)), **describe_args)
+        for (_, args), (resource_name, resources) in zip(requests, results):
+            yield args["region"], resource_name, resources
+
     def _get_tag_resource(self):
         """
         Returns the name of the resource to retrieve the tags for the resource of type specified by resource name
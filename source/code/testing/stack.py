@@ -37,7 +37,7 @@ class Stack(object):
     @property
     def stack_id(self):
         if self._stack_id is None:
-            stacks = self.cnf_service.describe(services.cloudformation_service.STACKS_SUMMARY)
+            stacks = self.cnf_service.describe(self.cnf_service.preferred_listing_resource())
             self._stack_id = [s for s in stacks
                               if s.get("StackName", "") == self.stack_name and s["StackStatus"] != "DELETE_COMPLETE"][0]["StackId"]
         return self._stack_id
@@ -0,0 +1,52 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import unittest
+
+from services.cloudformation_service import CloudformationService, CUSTOM_RESULT_PATHS, STACK_LIST, TEMPLATE, TEMPLATE_SUMMARY
+
+
+def _joined_result_path(attributes):
+    # the way the result paths were built before they were written as literals
+    return "{" + ",".join(['"{}":{}'.format(i, i) for i in attributes]) + "}"
+
+
+class TestCloudformationService(unittest.TestCase):
+    def test_template_result_path(self):
+        self.assertEqual(CUSTOM_RESULT_PATHS[TEMPLATE], _joined_result_path(["TemplateBody", "StagesAvailable"]))
+
+    def test_template_summary_result_path(self):
+        self.assertEqual(CUSTOM_RESULT_PATHS[TEMPLATE_SUMMARY], _joined_result_path([
+            "Parameters",
+            "Description",
+            "Capabilities",
+            "CapabilitiesReason",
+            "ResourceTypes",
+            "Version",
+            "Metadata",
+            "DeclaredTransforms"
+        ]))
+
+    def test_template_method_names(self):
+        service = CloudformationService()
+        self.assertEqual(service.describe_resources_function_name(TEMPLATE), "get_template")
+        self.assertEqual(service.describe_resources_function_name(TEMPLATE_SUMMARY), "get_template_summary")
+        self.assertEqual(service.required_describe_resource_permissions(TEMPLATE), ["cloudformation:GetTemplate"])
+        self.assertEqual(service.required_describe_resource_permissions(TEMPLATE_SUMMARY),
+                         ["cloudformation:GetTemplateSummary"])
+
+    def test_preferred_listing_resource(self):
+        service = CloudformationService()
+        self.assertEqual(CloudformationService.preferred_listing_resource(), STACK_LIST)
+        self.assertIn(STACK_LIST, service.resources)
+        self.assertEqual(service.describe_resources_function_name(STACK_LIST), "list_stacks")
+        self.assertEqual(service.required_describe_resource_permissions(STACK_LIST), ["cloudformation:ListStacks"])
@@ -0,0 +1,67 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import unittest
+from datetime import datetime, timedelta
+
+import pytz
+
+from scheduling.cron_expression import CronExpression
+
+
+class TestCronExpression(unittest.TestCase):
+    def test_next_minutes(self):
+        start = datetime(2019, 1, 1, 10, 3, tzinfo=pytz.utc)
+        self.assertEqual(CronExpression("*/15 * * * ?").first_within_next(timedelta(hours=1), start),
+                         datetime(2019, 1, 1, 10, 15, tzinfo=pytz.utc))
+        self.assertEqual(CronExpression("0,30 * * * ?").first_within_next(timedelta(hours=1), start),
+                         datetime(2019, 1, 1, 10, 30, tzinfo=pytz.utc))
+        self.assertEqual(CronExpression("0 * * * ?").first_within_next(timedelta(hours=1), start),
+                         datetime(2019, 1, 1, 11, 0, tzinfo=pytz.utc))
+
+    def test_previous_minutes(self):
+        end = datetime(2019, 1, 1, 10, 3, tzinfo=pytz.utc)
+        self.assertEqual(CronExpression("*/15 * * * ?").last_within_last(timedelta(hours=1), end),
+                         datetime(2019, 1, 1, 10, 0, tzinfo=pytz.utc))
+        self.assertEqual(CronExpression("45 * * * ?").last_within_last(timedelta(hours=1), end),
+                         datetime(2019, 1, 1, 9, 45, tzinfo=pytz.utc))
+
+    def test_next_month_wraps_to_next_year(self):
+        start = datetime(2019, 7, 1, tzinfo=pytz.utc)
+        self.assertEqual(list(CronExpression("0 0 1 2,5 ?").within_next(timedelta(days=365), start)),
+                         [datetime(2020, 2, 1, tzinfo=pytz.utc), datetime(2020, 5, 1, tzinfo=pytz.utc)])
+
+    def test_previous_month_wraps_to_previous_year(self):
+        end = datetime(2019, 1, 15, tzinfo=pytz.utc)
+        self.assertEqual(list(CronExpression("0 0 1 5,11 ?").within_last(timedelta(days=365), end)),
+                         [datetime(2018, 11, 1, tzinfo=pytz.utc), datetime(2018, 5, 1, tzinfo=pytz.utc)])
+
+    def test_repeated_first_within_next(self):
+        cron = CronExpression("0 */6 * * ?")
+        start = datetime(2019, 1, 1, 1, 0, tzinfo=pytz.utc)
+        for minutes in [0, 1, 59, 299]:
+            self.assertEqual(cron.first_within_next(timedelta(hours=24), start + timedelta(minutes=minutes)),
+                             datetime(2019, 1, 1, 6, 0, tzinfo=pytz.utc))
+        self.assertEqual(cron.first_within_next(timedelta(hours=24), start + timedelta(minutes=299, seconds=30)),
+                         datetime(2019, 1, 1, 6, 0, tzinfo=pytz.utc))
+        self.assertEqual(cron.first_within_next(timedelta(hours=24), start + timedelta(minutes=300)),
+                         datetime(2019, 1, 1, 12, 0, tzinfo=pytz.utc))
+        self.assertIsNone(cron.first_within_next(timedelta(hours=1), start))
+
+    def test_repeated_first_within_next_other_timezone(self):
+        cron = CronExpression("0 10 * * ?")
+        self.assertEqual(cron.first_within_next(timedelta(hours=24), datetime(2019, 1, 1, 5, 0, tzinfo=pytz.utc)),
+                         datetime(2019, 1, 1, 10, 0, tzinfo=pytz.utc))
+        # same instant as 06:00 UTC, which is between the previous start and match, but 10:00 in this timezone is 15:00 UTC
+        eastern = pytz.timezone("US/Eastern")
+        self.assertEqual(cron.first_within_next(timedelta(hours=24), eastern.localize(datetime(2019, 1, 1, 1, 0))),
+                         eastern.localize(datetime(2019, 1, 1, 10, 0)))
@@ -63,6 +63,9 @@ class TestSetBuilder(unittest.TestCase):
         for value in range(1, len(names) + 1):
             self.assertEqual(SetBuilder(names=names, offset=1).build(str(value)), {value})
 
+        # values for names are an immutable sequence
+        self.assertEqual(SetBuilder(names=names[0:3], offset=1).values, ("1", "2", "3"))
+
     def test_min_max(self):
         # builder initialized by min and max values
         for i in range(0, 5):
@@ -0,0 +1,82 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import unittest
+
+import boto3
+from botocore.stub import Stubber
+
+from services.aws_service import AwsService
+
+ACCOUNT = "123456789012"
+REGION = "us-east-1"
+PAGE_SIZE = 2
+
+
+def _volume(volume_id):
+    return {"VolumeId": volume_id, "Tags": [{"Key": "Name", "Value": volume_id}]}
+
+
+class TestAwsServiceDescribe(unittest.TestCase):
+
+    def setUp(self):
+        session = boto3.Session(aws_access_key_id="key", aws_secret_access_key="secret", region_name=REGION)
+        self.service = AwsService(service_name="ec2",
+                                  resource_names=["Volumes"],
+                                  resources_with_tags=["Volumes"],
+                                  session=session,
+                                  page_sizes={"Volumes": PAGE_SIZE})
+        # avoids retrieving the account of the credentials from sts
+        self.service._aws_account = ACCOUNT
+        self.stubber = Stubber(self.service.service_client(region=REGION))
+        self.stubber.add_response("describe_volumes",
+                                  {"Volumes": [_volume("vol-1"), _volume("vol-2")], "NextToken": "token-1"},
+                                  {"MaxResults": PAGE_SIZE})
+        self.stubber.add_response("describe_volumes",
+                                  {"Volumes": [_volume("vol-3"), _volume("vol-4")], "NextToken": "token-2"},
+                                  {"MaxResults": PAGE_SIZE, "NextToken": "token-1"})
+        self.stubber.add_response("describe_volumes",
+                                  {"Volumes": [_volume("vol-5")]},
+                                  {"MaxResults": PAGE_SIZE, "NextToken": "token-2"})
+        self.stubber.activate()
+
+    def tearDown(self):
+        self.stubber.deactivate()
+
+    def _check_pages(self, prefetch):
+        volumes = list(self.service.describe("Volumes", region=REGION, tags=True, prefetch=prefetch))
+
+        self.assertEqual([v["VolumeId"] for v in volumes], ["vol-1", "vol-2", "vol-3", "vol-4", "vol-5"])
+        for volume in volumes:
+            self.assertEqual(volume["AwsAccount"], ACCOUNT)
+            self.assertEqual(volume["Region"], REGION)
+            self.assertEqual(volume["Service"], "ec2")
+            self.assertEqual(volume["ResourceTypeName"], "Volumes")
+            self.assertEqual(volume["Tags"], {"Name": volume["VolumeId"]})
+        self.stubber.assert_no_pending_responses()
+
+    def test_describe_pages(self):
+        self._check_pages(prefetch=False)
+
+    def test_describe_pages_with_prefetch(self):
+        self._check_pages(prefetch=True)
+
+    def test_describe_tags_as_list(self):
+        volumes = list(self.service.describe("Volumes", region=REGION, tags=True, tags_as_dict=False, prefetch=True))
+        self.assertEqual([v["Tags"] for v in volumes], [[{"Key": "Name", "Value": v["VolumeId"]}] for v in volumes])
+
+    def test_stop_reading_before_last_page(self):
+        results = self.service.describe("Volumes", region=REGION, prefetch=False)
+        self.assertEqual(next(results)["VolumeId"], "vol-1")
+        results.close()
+        # the remaining pages are not requested
+        self.assertRaises(AssertionError, self.stubber.assert_no_pending_responses)
@@ -0,0 +1,69 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import unittest
+
+import boto3
+from botocore.stub import Stubber
+
+from services.aws_service import ERR_UNEXPECTED_MULTIPLE_RESULTS, GET_PAGE_SIZE
+from services.ec2_service import Ec2Service, MIN_PAGE_SIZES, VOLUMES
+from services.kms_service import KmsService
+
+ACCOUNT = "123456789012"
+REGION = "us-east-1"
+
+
+class TestAwsServiceGet(unittest.TestCase):
+
+    def _stubbed_service(self, service_class):
+        session = boto3.Session(aws_access_key_id="key", aws_secret_access_key="secret", region_name=REGION)
+        service = service_class(session=session)
+        # avoids retrieving the account of the credentials from sts
+        service._aws_account = ACCOUNT
+        stubber = Stubber(service.service_client(region=REGION))
+        stubber.activate()
+        self.addCleanup(stubber.deactivate)
+        return service, stubber
+
+    def test_get_multiple_results(self):
+        service, stubber = self._stubbed_service(Ec2Service)
+        stubber.add_response("describe_volumes",
+                             {"Volumes": [{"VolumeId": "vol-1"}, {"VolumeId": "vol-2"}], "NextToken": "token"},
+                             {"MaxResults": MIN_PAGE_SIZES[VOLUMES]})
+        with self.assertRaises(Exception) as context:
+            service.get("Volumes", region=REGION)
+        self.assertIn(ERR_UNEXPECTED_MULTIPLE_RESULTS, str(context.exception))
+        stubber.assert_no_pending_responses()
+
+    def test_get_single_result(self):
+        service, stubber = self._stubbed_service(Ec2Service)
+        stubber.add_response("describe_volumes", {"Volumes": [{"VolumeId": "vol-1"}]}, {"MaxResults": MIN_PAGE_SIZES[VOLUMES]})
+        self.assertEqual(service.get("Volumes", region=REGION)["VolumeId"], "vol-1")
+        stubber.assert_no_pending_responses()
+
+    def test_get_no_result(self):
+        service, stubber = self._stubbed_service(Ec2Service)
+        stubber.add_response("describe_volumes", {"Volumes": []}, {"MaxResults": MIN_PAGE_SIZES[VOLUMES]})
+        self.assertIsNone(service.get("Volumes", region=REGION))
+
+    def test_get_page_size_without_minimum(self):
+        service, stubber = self._stubbed_service(KmsService)
+        stubber.add_response("list_keys", {"Keys": [{"KeyId": "key-1"}], "Truncated": False}, {"Limit": GET_PAGE_SIZE})
+        self.assertEqual(service.get("Keys", region=REGION)["KeyId"], "key-1")
+        stubber.assert_no_pending_responses()
+
+    def test_get_by_id_without_page_size(self):
+        service, stubber = self._stubbed_service(Ec2Service)
+        stubber.add_response("describe_volumes", {"Volumes": [{"VolumeId": "vol-1"}]}, {"VolumeIds": ["vol-1"]})
+        self.assertEqual(service.get("Volumes", region=REGION, VolumeIds=["vol-1"])["VolumeId"], "vol-1")
+        stubber.assert_no_pending_responses()
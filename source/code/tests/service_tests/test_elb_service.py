@@ -0,0 +1,76 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import unittest
+
+import boto3
+from botocore.stub import Stubber
+
+from services.elb_service import DESCRIBE_TAGS_MAX_NAMES, ElbService
+
+ACCOUNT = "123456789012"
+REGION = "us-east-1"
+NUMBER_OF_LOAD_BALANCERS = DESCRIBE_TAGS_MAX_NAMES + 5
+
+
+def _name(i):
+    return "elb-{}".format(i)
+
+
+def _tags(i):
+    # every third load balancer has a Backup tag, the tag of the last load balancer has no value
+    tags = [{"Key": "Name", "Value": _name(i)}]
+    if i % 3 == 0:
+        tags.append({"Key": "Backup"} if i == NUMBER_OF_LOAD_BALANCERS - 1 else {"Key": "Backup", "Value": "yes"})
+    return tags
+
+
+class TestElbService(unittest.TestCase):
+
+    def setUp(self):
+        session = boto3.Session(aws_access_key_id="key", aws_secret_access_key="secret", region_name=REGION)
+        self.service = ElbService(session=session)
+        # avoids retrieving the account of the credentials from sts
+        self.service._aws_account = ACCOUNT
+        self.stubber = Stubber(self.service.service_client(region=REGION))
+
+        names = [_name(i) for i in range(NUMBER_OF_LOAD_BALANCERS)]
+        self.stubber.add_response("describe_load_balancers",
+                                  {"LoadBalancerDescriptions": [{"LoadBalancerName": name} for name in names]}, {})
+        # tags are retrieved for 20 and then for the remaining 5 load balancers
+        for first in range(0, NUMBER_OF_LOAD_BALANCERS, DESCRIBE_TAGS_MAX_NAMES):
+            batch = range(first, min(first + DESCRIBE_TAGS_MAX_NAMES, NUMBER_OF_LOAD_BALANCERS))
+            self.stubber.add_response("describe_tags",
+                                      {"TagDescriptions": [{"LoadBalancerName": _name(i), "Tags": _tags(i)} for i in batch]},
+                                      {"LoadBalancerNames": [_name(i) for i in batch]})
+        self.stubber.activate()
+
+    def tearDown(self):
+        self.stubber.deactivate()
+
+    def test_tags_in_batches(self):
+        load_balancers = list(self.service.describe("LoadBalancers", region=REGION, tags=True))
+
+        self.assertEqual([lb["LoadBalancerName"] for lb in load_balancers], [_name(i) for i in range(NUMBER_OF_LOAD_BALANCERS)])
+        for i, lb in enumerate(load_balancers):
+            self.assertEqual(lb["Tags"], {tag["Key"]: tag.get("Value", "") for tag in _tags(i)})
+        self.stubber.assert_no_pending_responses()
+
+    def test_select_on_tag_with_tags_as_list(self):
+        load_balancers = list(self.service.describe("LoadBalancers", region=REGION, tags=True, tags_as_dict=False,
+                                                    select_on_tag="Backup"))
+
+        selected = [i for i in range(NUMBER_OF_LOAD_BALANCERS) if i % 3 == 0]
+        self.assertEqual([lb["LoadBalancerName"] for lb in load_balancers], [_name(i) for i in selected])
+        for i, lb in zip(selected, load_balancers):
+            self.assertEqual(lb["Tags"], [{"Key": tag["Key"], "Value": tag.get("Value", "")} for tag in _tags(i)])
+        self.stubber.assert_no_pending_responses()
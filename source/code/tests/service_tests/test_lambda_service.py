@@ -0,0 +1,109 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import threading
+import unittest
+from unittest import mock
+
+import boto3
+import botocore.exceptions
+from botocore.stub import Stubber
+
+from services.lambda_service import LambdaService, LIST_TAGS_WORKERS
+
+ACCOUNT = "123456789012"
+REGION = "us-east-1"
+
+
+def _arn(i):
+    return "arn:aws:lambda:{}:{}:function:function-{}".format(REGION, ACCOUNT, i)
+
+
+class TestLambdaService(unittest.TestCase):
+
+    def _stubbed_service(self, number_of_functions):
+        session = boto3.Session(aws_access_key_id="key", aws_secret_access_key="secret", region_name=REGION)
+        service = LambdaService(session=session)
+        # avoids retrieving the account of the credentials from sts
+        service._aws_account = ACCOUNT
+        client = service.service_client(region=REGION)
+        stubber = Stubber(client)
+        stubber.add_response("list_functions",
+                             {"Functions": [{"FunctionName": "function-{}".format(i), "FunctionArn": _arn(i)}
+                                            for i in range(number_of_functions)]}, {})
+        stubber.activate()
+        self.addCleanup(stubber.deactivate)
+        return service, client
+
+    def test_tags_for_functions_completed_out_of_order(self):
+        number_of_functions = 5
+        service, client = self._stubbed_service(number_of_functions)
+
+        completed = []
+        lock = threading.Lock()
+        others_completed = threading.Event()
+
+        def list_tags(Resource):
+            # the call for the first function only returns after the calls for all other functions have returned
+            if Resource == _arn(0):
+                self.assertTrue(others_completed.wait(timeout=10))
+            with lock:
+                completed.append(Resource)
+                if len(completed) == number_of_functions - 1:
+                    others_completed.set()
+            return {"Tags": {"Name": Resource}}
+
+        with mock.patch.object(client, "list_tags", side_effect=list_tags):
+            functions = list(service.describe("Functions", region=REGION, tags=True))
+
+        self.assertEqual(completed[-1], _arn(0))
+        self.assertEqual([f["FunctionArn"] for f in functions], [_arn(i) for i in range(number_of_functions)])
+        for function in functions:
+            self.assertEqual(function["Tags"], {"Name": function["FunctionArn"]})
+
+    def test_tagging_api_used_for_larger_pages(self):
+        number_of_functions = LIST_TAGS_WORKERS + 1
+        service, client = self._stubbed_service(number_of_functions)
+
+        cached_tags = {_arn(i): [{"Key": "Name", "Value": _arn(i)}] for i in range(number_of_functions)}
+        with mock.patch.object(service, "cached_tags", return_value=cached_tags) as tagging_api, \
+                mock.patch.object(client, "list_tags") as list_tags:
+            functions = list(service.describe("Functions", region=REGION, tags=True))
+
+        self.assertTrue(tagging_api.called)
+        self.assertFalse(list_tags.called)
+        for function in functions:
+            self.assertEqual(function["Tags"], {"Name": function["FunctionArn"]})
+
+    def test_tagging_api_access_denied(self):
+        number_of_functions = LIST_TAGS_WORKERS + 1
+        service, client = self._stubbed_service(number_of_functions)
+
+        denied = botocore.exceptions.ClientError({"Error": {"Code": "AccessDeniedException"}}, "GetResources")
+        with mock.patch.object(service, "cached_tags", side_effect=denied) as tagging_api, \
+                mock.patch.object(client, "list_tags", side_effect=lambda Resource: {"Tags": {"Name": Resource}}) as list_tags:
+            functions = list(service.describe("Functions", region=REGION, tags=True))
+
+        # the tagging api is not called again after the access was denied
+        self.assertEqual(tagging_api.call_count, 1)
+        self.assertEqual(sorted(c[1]["Resource"] for c in list_tags.call_args_list),
+                         sorted(_arn(i) for i in range(number_of_functions)))
+        for function in functions:
+            self.assertEqual(function["Tags"], {"Name": function["FunctionArn"]})
+
+    def test_tagging_api_other_errors_raised(self):
+        service, client = self._stubbed_service(LIST_TAGS_WORKERS + 1)
+
+        throttled = botocore.exceptions.ClientError({"Error": {"Code": "ThrottlingException"}}, "GetResources")
+        with mock.patch.object(service, "cached_tags", side_effect=throttled), mock.patch.object(client, "list_tags"):
+            with self.assertRaises(botocore.exceptions.ClientError):
+                list(service.describe("Functions", region=REGION, tags=True))
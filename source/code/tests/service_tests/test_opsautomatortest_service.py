@@ -0,0 +1,49 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import unittest
+
+try:
+    from services.opsautomatortest_service import _range_from_spec, _tags_from_str
+except ImportError:
+    # the test service imports the ops automator test action module, which is not included in this source tree
+    _range_from_spec = _tags_from_str = None
+
+
+@unittest.skipIf(_range_from_spec is None, "actions.ops_automator_test_action is not available")
+class TestOpsautomatortestService(unittest.TestCase):
+    def test_range_from_spec(self):
+        self.assertEqual(_range_from_spec("1-100", 100), range(1, 101))
+        self.assertEqual(_range_from_spec("0-0", 100), range(0, 1))
+        self.assertEqual(_range_from_spec("5-5", 5), range(5, 6))
+
+    def test_range_from_spec_not_a_single_range(self):
+        for spec in ["", "1", "1-", "-5", "1-5,7", "1 - 5", "a-b", "1-5/2", "{\"*\": \"1-5\"}"]:
+            self.assertIsNone(_range_from_spec(spec, 100), spec)
+
+    def test_range_from_spec_out_of_bounds(self):
+        self.assertIsNone(_range_from_spec("5-1", 100))
+        self.assertIsNone(_range_from_spec("1-101", 100))
+
+    def test_tags_from_str(self):
+        self.assertEqual(_tags_from_str(""), {})
+        self.assertEqual(_tags_from_str("a=1"), {"a": "1"})
+        self.assertEqual(_tags_from_str(" a = 1 , b=2"), {"a": "1", "b": "2"})
+        self.assertEqual(_tags_from_str("a="), {"a": ""})
+        self.assertEqual(_tags_from_str("a=x=y"), {"a": "x=y"})
+
+    def test_tags_from_str_values_with_commas(self):
+        self.assertEqual(_tags_from_str("a=1,2, 3,b=4"), {"a": "1,2,3", "b": "4"})
+        # parts before the first key are ignored
+        self.assertEqual(_tags_from_str("x,a=1"), {"a": "1"})
+        # a repeated key keeps the last value
+        self.assertEqual(_tags_from_str("a=1,a=2,3"), {"a": "2,3"})
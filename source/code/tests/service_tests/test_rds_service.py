@@ -0,0 +1,93 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import threading
+import unittest
+from unittest import mock
+
+import boto3
+
+from services.rds_service import DB_CLUSTERS, DB_INSTANCES, DB_SUBNET_GROUPS, RdsService
+
+ACCOUNT = "123456789012"
+REGIONS = ["us-east-1", "eu-west-1"]
+
+RESPONSES = {
+    "describe_db_instances": ("DBInstances", "DBInstanceIdentifier"),
+    "describe_db_clusters": ("DBClusters", "DBClusterIdentifier"),
+    "describe_db_subnet_groups": ("DBSubnetGroups", "DBSubnetGroupName")
+}
+
+
+class TestRdsServiceDescribeAll(unittest.TestCase):
+
+    def setUp(self):
+        session = boto3.Session(aws_access_key_id="key", aws_secret_access_key="secret", region_name=REGIONS[0])
+        self.service = RdsService(session=session)
+        # avoids retrieving the account of the credentials from sts
+        self.service._aws_account = ACCOUNT
+
+    def _patch_describe_methods(self, barrier):
+        threads = []
+
+        def describe_method(method_name, region):
+            result_name, id_name = RESPONSES[method_name]
+
+            def describe(**kwargs):
+                threads.append(threading.current_thread())
+                # all calls have to be running at the same time to pass the barrier
+                barrier.wait()
+                return {result_name: [{id_name: "{}-{}".format(region, method_name)}]}
+
+            return describe
+
+        for region in REGIONS:
+            client = self.service.service_client(region=region)
+            for method_name in RESPONSES:
+                patcher = mock.patch.object(client, method_name, side_effect=describe_method(method_name, region))
+                patcher.start()
+                self.addCleanup(patcher.stop)
+        return threads
+
+    def test_describe_all_in_parallel(self):
+        resource_names = [DB_INSTANCES, DB_CLUSTERS, DB_SUBNET_GROUPS]
+        number_of_requests = len(resource_names) * len(REGIONS)
+        barrier = threading.Barrier(number_of_requests, timeout=10)
+        threads = self._patch_describe_methods(barrier)
+
+        results = list(self.service.describe_all(resource_names, regions=REGIONS, max_workers=number_of_requests))
+
+        self.assertEqual([(region, resource_name) for region, resource_name, _ in results],
+                         [(region, resource_name) for region in REGIONS for resource_name in resource_names])
+        for region, resource_name, resources in results:
+            self.assertEqual(len(resources), 1)
+            self.assertEqual(resources[0]["Region"], region)
+            self.assertEqual(resources[0]["ResourceTypeName"], resource_name)
+            self.assertEqual(resources[0]["AwsAccount"], ACCOUNT)
+        self.assertEqual(len(set(threads)), number_of_requests)
+        # the copies called the patched clients of this instance and did not add clients
+        self.assertEqual(sorted(self.service._service_clients), sorted(REGIONS))
+
+    def test_describe_many_with_fewer_workers(self):
+        # two threads for four requests, the calls of each pair of requests have to run at the same time
+        barrier = threading.Barrier(2, timeout=10)
+        threads = self._patch_describe_methods(barrier)
+
+        requests = [(DB_INSTANCES, None),
+                    (DB_CLUSTERS, None),
+                    (DB_SUBNET_GROUPS, None),
+                    (DB_SUBNET_GROUPS, {"region": REGIONS[1]})]
+        results = list(self.service.describe_many(requests, region=REGIONS[0], max_workers=2))
+
+        self.assertEqual([resource_name for resource_name, _ in results], [resource_name for resource_name, _ in requests])
+        self.assertEqual([resources[0]["Region"] for _, resources in results], [REGIONS[0]] * 3 + [REGIONS[1]])
+        self.assertEqual(len(set(threads)), 2)
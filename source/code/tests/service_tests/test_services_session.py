@@ -0,0 +1,65 @@
+###################################################################################################################### 
+#  Copyright 2019 Amazon.com, Inc. or its affiliates. All Rights Reserved.                                           # 
+#                                                                                                                    # 
+#  Licensed under the Apache License Version 2.0 (the "License"). You may not use this file except in compliance     # 
+#  with the License. A copy of the License is located at                                                             # 
+#                                                                                                                    # 
+#      http://www.apache.org/licenses/                                                                               # 
+#                                                                                                                    # 
+#  or in the "license" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES # 
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions    # 
+#  and limitations under the License.                                                                                # 
+######################################################################################################################
+import unittest
+from datetime import datetime, timedelta
+
+import pytz
+from botocore.stub import ANY, Stubber
+
+import services
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/ops-automator-test"
+
+
+def _credentials(key_id, valid_for):
+    return {
+        "Credentials": {
+            "AccessKeyId": key_id,
+            "SecretAccessKey": "secret-{}".format(key_id),
+            "SessionToken": "token-{}".format(key_id),
+            "Expiration": datetime.now(pytz.utc) + valid_for
+        }
+    }
+
+
+class TestGetSession(unittest.TestCase):
+
+    def setUp(self):
+        services._role_credentials.pop(ROLE_ARN, None)
+        self.stubber = Stubber(services.get_sts_client())
+        self.stubber.activate()
+
+    def tearDown(self):
+        self.stubber.deactivate()
+        services._role_credentials.pop(ROLE_ARN, None)
+
+    def _add_assume_role(self, key_id, valid_for):
+        self.stubber.add_response("assume_role", _credentials(key_id, valid_for),
+                                  {"RoleArn": ROLE_ARN, "RoleSessionName": ANY})
+
+    def _access_key(self):
+        return services.get_session(role_arn=ROLE_ARN).get_credentials().access_key
+
+    def test_credentials_reused_before_margin(self):
+        self._add_assume_role("ASIAFIRSTACCESSKEY", services.ROLE_CREDENTIALS_MARGIN + timedelta(minutes=1))
+        self.assertEqual(self._access_key(), "ASIAFIRSTACCESSKEY")
+        self.assertEqual(self._access_key(), "ASIAFIRSTACCESSKEY")
+        self.stubber.assert_no_pending_responses()
+
+    def test_role_assumed_again_within_margin(self):
+        self._add_assume_role("ASIAFIRSTACCESSKEY", services.ROLE_CREDENTIALS_MARGIN - timedelta(minutes=1))
+        self._add_assume_role("ASIASECONDACCESSKEY", timedelta(hours=1))
+        self.assertEqual(self._access_key(), "ASIAFIRSTACCESSKEY")
+        self.assertEqual(self._access_key(), "ASIASECONDACCESSKEY")
+        self.assertEqual(self._access_key(), "ASIASECONDACCESSKEY")
+        self.stubber.assert_no_pending_responses()